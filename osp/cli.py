@@ -16,13 +16,10 @@ from pathlib import Path
 import click
 
 from osp import __version__
-from osp.generator import (
-    init_workspace,
-    list_available_seeds,
-    preview_file,
-)
-from osp.updater import read_osp_meta, update_workspace
-from osp.validator import validate_file
+
+# Subcommand dependencies (generator, updater, validator and through them
+# yaml) are imported inside each command so `osp --version` / `--help`
+# and unrelated commands don't pay their import cost.
 
 
 @click.group()
@@ -41,6 +38,8 @@ def main() -> None:
 )
 def init(seed: str, workspace: str) -> None:
     """Generate an OpenClaw workspace from a soul seed."""
+    from osp.generator import init_workspace
+
     output_dir = Path(workspace)
 
     try:
@@ -56,6 +55,8 @@ def init(seed: str, workspace: str) -> None:
 @main.command("list")
 def list_seeds() -> None:
     """List all available built-in seeds."""
+    from osp.generator import list_available_seeds
+
     seeds = list_available_seeds()
 
     if not seeds:
@@ -74,6 +75,8 @@ def list_seeds() -> None:
 @click.option("--file", "filename", default=None, help="Specific file to preview (default: SOUL.md).")
 def preview(seed: str, filename: str | None) -> None:
     """Preview the generated output for a seed."""
+    from osp.generator import preview_file
+
     try:
         content = preview_file(seed, filename)
         click.echo(content)
@@ -85,7 +88,9 @@ def preview(seed: str, filename: str | None) -> None:
 @click.argument("path", type=click.Path(exists=True))
 def validate(path: str) -> None:
     """Validate a YAML seed file against the OSP schema."""
-    result = validate_file(path)
+    from osp.validator import validate_file_fast
+
+    result = validate_file_fast(path)
 
     if result.is_valid:
         click.echo(f"Valid: {result.path}")
@@ -105,6 +110,8 @@ def validate(path: str) -> None:
 )
 def status(workspace: str) -> None:
     """Display workspace status including seed info and version."""
+    from osp.updater import read_osp_meta
+
     workspace_path = Path(workspace)
 
     if not workspace_path.exists():
@@ -130,9 +137,15 @@ def status(workspace: str) -> None:
 )
 @click.option("--seed", default=None, help="Seed name to update to (optional).")
 @click.option("--dry-run", is_flag=True, help="Preview changes without modifying files.")
-@click.option("--force", is_flag=True, help="Force update even without existing meta.")
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Force update even without existing meta or when already up to date.",
+)
 def update(workspace: str, seed: str | None, dry_run: bool, force: bool) -> None:
     """Update workspace with the latest seed version."""
+    from osp.updater import update_workspace
+
     workspace_path = Path(workspace)
 
     if not workspace_path.exists():
@@ -158,6 +171,9 @@ def update(workspace: str, seed: str | None, dry_run: bool, force: bool) -> None
         click.echo(f"Updating from v{result.from_version} to v{result.to_version}...")
     else:
         click.echo(f"Current: v{result.from_version} (latest)")
+        if not result.changes:
+            click.echo("Already up to date. Use --force to re-apply seed files.")
+            return
 
     # Display changes
     if dry_run:
@@ -166,11 +182,16 @@ def update(workspace: str, seed: str | None, dry_run: bool, force: bool) -> None
             click.echo(f"  {change.filename}: {change.details}")
         click.echo("\nRun without --dry-run to apply changes.")
     else:
-        # Categorize changes
-        overwritten = [c for c in result.changes if c.action == "overwritten"]
-        merged = [c for c in result.changes if "merged" in c.action]
-        preserved = [c for c in result.changes if c.action == "preserved"]
-        skipped = [c for c in result.changes if c.action == "skipped"]
+        # Categorize changes in a single pass (all *_merged actions share a bucket)
+        buckets: dict[str, list] = {"overwritten": [], "merged": [], "preserved": []}
+        for change in result.changes:
+            key = "merged" if change.action.endswith("merged") else change.action
+            bucket = buckets.get(key)
+            if bucket is not None:
+                bucket.append(change)
+        overwritten = buckets["overwritten"]
+        merged = buckets["merged"]
+        preserved = buckets["preserved"]
 
         if overwritten:
             click.echo("\nUpdated:")
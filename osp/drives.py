@@ -7,13 +7,18 @@ Unknown drives gracefully fall back to a universal template.
 
 from __future__ import annotations
 
+import sys
+from types import MappingProxyType
+from typing import Mapping
+
 # Tier boundaries: [0.0, 0.2) dormant | [0.2, 0.4) low | [0.4, 0.6) moderate | [0.6, 0.8) high | [0.8, 1.0] dominant
 TIER_THRESHOLDS = (0.0, 0.20, 0.40, 0.60, 0.80, 1.01)
-TIER_NAMES = ("dormant", "low", "moderate", "high", "dominant")
+# Interned so tier keys built from these compare by identity in dict lookups
+TIER_NAMES = tuple(sys.intern(t) for t in ("dormant", "low", "moderate", "high", "dominant"))
 
 # === 10 Known Drives x 5 Tiers = 50 Descriptions ===
 
-DRIVE_DESCRIPTIONS: dict[str, dict[str, str]] = {
+_RAW_DRIVE_DESCRIPTIONS: dict[str, dict[str, str]] = {
     "curiosity": {
         "dormant": "Unknown holds no allure for you. You are content within the boundaries of what is already known, rarely asking why.",
         "low": "You are occasionally curious but seldom dive deep. Questions arise and pass like clouds — noticed but not chased.",
@@ -86,23 +91,42 @@ DRIVE_DESCRIPTIONS: dict[str, dict[str, str]] = {
     },
 }
 
+# Read-only views: the tables are shared process-wide (and baked into the
+# flat lookup below), so they must never be mutated at runtime
+DRIVE_DESCRIPTIONS: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {name: MappingProxyType(tiers) for name, tiers in _RAW_DRIVE_DESCRIPTIONS.items()}
+)
+
 # Universal template for unknown drives
-_GENERIC_TEMPLATES: dict[str, str] = {
+_GENERIC_TEMPLATES: Mapping[str, str] = MappingProxyType({
     "dormant": "The drive '{name}' is virtually absent. It exerts no noticeable influence on your behavior.",
     "low": "The drive '{name}' exists as a faint background signal. You are aware of it but rarely act on it.",
     "moderate": "The drive '{name}' is balanced within you. It surfaces in appropriate contexts and retreats when not needed.",
     "high": "The drive '{name}' strongly influences your behavior. It is a prominent force in how you process and respond.",
     "dominant": "The drive '{name}' is overwhelming. It colors every thought, shapes every response, and defines your core identity.",
-}
+})
+
+# Flat lookup table: drive i's description for tier t is _DRIVE_TABLE[i * _TIER_COUNT + t],
+# so a known-drive lookup is one string hash plus one tuple index
+_DRIVE_INDEX: Mapping[str, int] = MappingProxyType(
+    {sys.intern(name): i for i, name in enumerate(DRIVE_DESCRIPTIONS)}
+)
+_DRIVE_TABLE: tuple[str, ...] = tuple(
+    DRIVE_DESCRIPTIONS[name][tier] for name in DRIVE_DESCRIPTIONS for tier in TIER_NAMES
+)
+_TIER_COUNT = len(TIER_NAMES)
+
+
+def _value_to_tier_index(value: float) -> int:
+    """Convert a 0.0-1.0 float to an index into TIER_NAMES."""
+    clamped = max(0.0, min(1.0, float(value)))
+    # Tiers are uniform 0.2-wide buckets (see TIER_THRESHOLDS), so index directly
+    return min(int(clamped * 5), 4)
 
 
 def _value_to_tier(value: float) -> str:
     """Convert a 0.0-1.0 float to a tier name."""
-    clamped = max(0.0, min(1.0, float(value)))
-    for i in range(len(TIER_NAMES)):
-        if clamped < TIER_THRESHOLDS[i + 1]:
-            return TIER_NAMES[i]
-    return TIER_NAMES[-1]
+    return TIER_NAMES[_value_to_tier_index(value)]
 
 
 def translate_drive(name: str, value: float) -> str:
@@ -111,12 +135,13 @@ def translate_drive(name: str, value: float) -> str:
     Known drives get hand-crafted descriptions.
     Unknown drives fall back to the generic template.
     """
-    tier = _value_to_tier(value)
+    tier_index = _value_to_tier_index(value)
 
-    if name in DRIVE_DESCRIPTIONS:
-        return DRIVE_DESCRIPTIONS[name][tier]
+    drive_index = _DRIVE_INDEX.get(name)
+    if drive_index is not None:
+        return _DRIVE_TABLE[drive_index * _TIER_COUNT + tier_index]
 
-    return _GENERIC_TEMPLATES[tier].format(name=name)
+    return _GENERIC_TEMPLATES[TIER_NAMES[tier_index]].format(name=name)
 
 
 def translate_all_drives(drives: dict[str, float]) -> dict[str, str]:
@@ -124,4 +149,19 @@ def translate_all_drives(drives: dict[str, float]) -> dict[str, str]:
 
     Returns a dict mapping drive_name -> natural language description.
     """
-    return {name: translate_drive(name, value) for name, value in drives.items()}
+    # Hot loop: bind globals to locals and inline _value_to_tier_index
+    index_get = _DRIVE_INDEX.get
+    table = _DRIVE_TABLE
+    generic = _GENERIC_TEMPLATES
+    tier_names = TIER_NAMES
+    tier_count = _TIER_COUNT
+
+    translations: dict[str, str] = {}
+    for name, value in drives.items():
+        tier_index = min(int(max(0.0, min(1.0, float(value))) * 5), 4)
+        drive_index = index_get(name)
+        if drive_index is not None:
+            translations[name] = table[drive_index * tier_count + tier_index]
+        else:
+            translations[name] = generic[tier_names[tier_index]].format(name=name)
+    return translations
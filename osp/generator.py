@@ -5,23 +5,67 @@ Pipeline: resolve_seed_path -> load -> validate -> generate -> write
 
 from __future__ import annotations
 
+import functools
 import json
-from datetime import datetime
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 import yaml
 
 import osp
 
 from osp.models import OSPMeta, Seed
-from osp.templates import TEMPLATE_REGISTRY
-from osp.validator import load_seed_data, validate_file
+from osp.templates import TEMPLATE_ITEMS, TEMPLATE_REGISTRY, build_render_context
+from osp.validator import SeedLoader, load_seed_data
 
 
 # Built-in seeds directory (relative to project root)
 SEEDS_DIR = Path(__file__).parent.parent / "seeds"
 
+# Registry snapshots: the registry is fixed for the life of the process
+_TEMPLATE_NAMES = frozenset(TEMPLATE_REGISTRY)
+_AVAILABLE_TEMPLATES = ", ".join(sorted(TEMPLATE_REGISTRY))
+
+# Top-level "meta:" block: the header line plus every indented line below it
+_META_BLOCK_PATTERN = re.compile(r"^meta:[ \t]*\n((?:[ \t].*\n?)+)", re.MULTILINE)
+
+
+# Extension last found for (seed name, absolute seeds dir)
+_SEED_EXTENSIONS: dict[tuple[str, str], str] = {}
+
+
+def _resolve_in_seeds_dir(seed_name: str, seeds_dir: Path) -> Path:
+    """Look up a seed name in a seeds directory.
+
+    Remembers which extension matched, keyed on the absolute directory so a
+    relative seeds_dir follows the working directory. A remembered hit is
+    checked again with one stat, so deleted or renamed seeds are never served.
+    """
+    key = (seed_name, os.path.abspath(seeds_dir))
+    ext = _SEED_EXTENSIONS.get(key)
+    if ext is not None:
+        path = seeds_dir / f"{seed_name}{ext}"
+        if path.is_file():
+            return path
+
+    for ext in (".yaml", ".yml"):
+        path = seeds_dir / f"{seed_name}{ext}"
+        if path.is_file():
+            _SEED_EXTENSIONS[key] = ext
+            return path
+
+    _SEED_EXTENSIONS.pop(key, None)
+
+    raise FileNotFoundError(
+        f"Seed '{seed_name}' not found. "
+        f"Searched in: {seeds_dir}/ and as direct path."
+    )
+
 
 def resolve_seed_path(seed_name: str, seeds_dir: Optional[Path] = None) -> Path:
     """Resolve a seed name or path to an actual file path.
@@ -30,26 +74,46 @@ def resolve_seed_path(seed_name: str, seeds_dir: Optional[Path] = None) -> Path:
       - A bare name like "tabula_rasa" (looks up in seeds_dir)
       - A full/relative file path like "seeds/custom.yaml"
 
+    Bare-name lookups are memoized per seeds directory.
+
     Raises:
         FileNotFoundError: If the seed cannot be found.
     """
     seeds_dir = seeds_dir or SEEDS_DIR
 
-    # If it's already a path to an existing file, use it directly
+    # A bare name (no separator, no extension) can only live in seeds_dir,
+    # so skip probing it as a direct path
     candidate = Path(seed_name)
-    if candidate.exists() and candidate.is_file():
+    is_bare_name = not candidate.suffix and len(candidate.parts) == 1
+    if not is_bare_name and candidate.is_file():
         return candidate
 
     # Try as a name in the seeds directory
-    for ext in (".yaml", ".yml"):
-        path = seeds_dir / f"{seed_name}{ext}"
-        if path.exists():
-            return path
+    return _resolve_in_seeds_dir(seed_name, seeds_dir)
 
-    raise FileNotFoundError(
-        f"Seed '{seed_name}' not found. "
-        f"Searched in: {seeds_dir}/ and as direct path."
-    )
+
+def _read_display_name(path: Path) -> str:
+    """Read a seed's display name, parsing only its `meta` block when possible.
+
+    Falls back to a full parse if the block can't be isolated or parsed on
+    its own, and to the file stem if the file can't be parsed at all.
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+        match = _META_BLOCK_PATTERN.search(text)
+        if match:
+            try:
+                meta = yaml.load(match.group(1), Loader=SeedLoader)
+            except yaml.YAMLError:
+                # The block's extent can be misjudged (flow style, anchors
+                # defined elsewhere); the whole document may still parse
+                meta = None
+            if isinstance(meta, dict) and "name" in meta:
+                return meta["name"]
+        data = yaml.load(text, Loader=SeedLoader)
+        return data.get("meta", {}).get("name", path.stem)
+    except Exception:
+        return path.stem
 
 
 def list_available_seeds(seeds_dir: Optional[Path] = None) -> list[dict[str, str]]:
@@ -63,75 +127,191 @@ def list_available_seeds(seeds_dir: Optional[Path] = None) -> list[dict[str, str
     if not seeds_dir.exists():
         return results
 
-    for path in sorted(seeds_dir.glob("*.yaml")):
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-            display_name = data.get("meta", {}).get("name", path.stem)
-        except Exception:
-            display_name = path.stem
+    # One directory pass for both extensions, ordered by file name
+    with os.scandir(seeds_dir) as it:
+        entries = sorted(
+            (e for e in it if e.name.endswith((".yaml", ".yml")) and e.is_file()),
+            key=lambda e: e.name,
+        )
 
+    for entry in entries:
+        path = Path(entry.path)
         results.append({
             "name": path.stem,
-            "path": str(path),
-            "display_name": display_name,
+            "path": entry.path,
+            "display_name": _read_display_name(path),
         })
 
-    for path in sorted(seeds_dir.glob("*.yml")):
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-            display_name = data.get("meta", {}).get("name", path.stem)
-        except Exception:
-            display_name = path.stem
+    return results
 
-        results.append({
-            "name": path.stem,
-            "path": str(path),
-            "display_name": display_name,
-        })
 
-    return results
+@functools.lru_cache(maxsize=128)
+def _load_seed_cached(path_str: str, mtime_ns: int, size: int) -> Seed:
+    """Parse a seed file into a Seed; mtime/size in the key invalidate stale entries."""
+    return Seed.from_dict(load_seed_data(path_str))
+
+
+@functools.lru_cache(maxsize=256)
+def _render_cached(path_str: str, mtime_ns: int, size: int, filename: str) -> str:
+    """Render a single template for a seed file, cached like _load_seed_cached."""
+    return TEMPLATE_REGISTRY[filename](_load_seed_cached(path_str, mtime_ns, size))
+
+
+def _seed_cache_key(seed_path: Path) -> tuple[str, int, int]:
+    """Build the (absolute path, mtime_ns, size) cache key for a seed file."""
+    st = seed_path.stat()
+    return os.path.abspath(seed_path), st.st_mtime_ns, st.st_size
+
+
+def load_seed(seed_path: Path) -> Seed:
+    """Load, validate and parse a seed file into a Seed.
+
+    Results are memoized per file and automatically invalidated when the file's modification time or size
+    changes.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        ValueError: If the seed is empty or invalid.
+    """
+    if not seed_path.exists():
+        raise FileNotFoundError(f"Seed file not found: {seed_path}")
+    return _load_seed_cached(*_seed_cache_key(seed_path))
 
 
-def generate_workspace(seed: Seed) -> dict[str, str]:
+def iter_workspace(seed: Seed) -> Iterator[tuple[str, str]]:
+    """Lazily render workspace files from a seed.
+
+    Yields (filename, content) pairs one template at a time, so callers
+    can consume each file before the next one is rendered. The shared
+    template context is built once for the whole pass.
+    """
+    context = build_render_context(seed)
+    for filename, render_fn in TEMPLATE_ITEMS:
+        yield filename, render_fn(seed, context)
+
+
+def generate_workspace(seed: Seed, max_workers: Optional[int] = None) -> dict[str, str]:
     """Generate all workspace files from a seed.
 
     Returns a dict mapping filename -> content.
     No filesystem writes — pure data transformation.
+
+    Args:
+        seed: The (frozen) seed to render.
+        max_workers: If greater than 1, render templates on a thread pool of
+            this size. Renderers are pure Python and GIL-bound, so this only
+            pays off for renderers that block or release the GIL; sequential
+            rendering is the default.
     """
-    workspace: dict[str, str] = {}
+    if not max_workers or max_workers <= 1:
+        return dict(iter_workspace(seed))
 
-    for filename, render_fn in TEMPLATE_REGISTRY.items():
-        workspace[filename] = render_fn(seed)
+    context = build_render_context(seed)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(TEMPLATE_ITEMS))) as pool:
+        rendered = pool.map(lambda item: (item[0], item[1](seed, context)), TEMPLATE_ITEMS)
+        return dict(rendered)
 
-    return workspace
 
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
 
-def write_workspace(workspace: dict[str, str], output_dir: Path) -> list[Path]:
-    """Write generated workspace files to disk.
+
+def _current_umask() -> int:
+    """Return the process umask; os.umask can only be queried by setting it."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Mode open() gives new files, read once at import rather than per write
+_NEW_FILE_MODE = 0o666 & ~_current_umask()
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write every byte to an open fd, retrying short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes with raw fd syscalls, skipping Python file-object setup.
+
+    New files get 0o666 less the umask, the same as Path.write_text.
+    """
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        _write_all(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _write_text_file(file_path: Path, content: str) -> Path:
+    """Encode once and write raw bytes.
+
+    Skips the text-layer encoder and keeps LF line endings identical on
+    every platform.
+    """
+    _write_bytes(file_path, content.encode("utf-8"))
+    return file_path
+
+
+def stream_write_workspace(
+    files: Iterable[tuple[str, str]],
+    output_dir: Path,
+    max_workers: Optional[int] = None,
+) -> list[Path]:
+    """Write (filename, content) pairs to disk as they are produced.
 
     Creates the output directory if it doesn't exist.
-    Skips files with empty content (e.g., BIOGRAPHY.md for seeds without stories).
-    Returns list of written file paths.
+    Skips files with empty content (e.g., STORY.md for seeds without stories).
+    Returns list of written file paths, in input order.
+
+    Args:
+        files: Iterable of (filename, content) pairs.
+        output_dir: Directory to write into.
+        max_workers: If greater than 1, issue writes from a thread pool of
+            this size. Helps on high-latency filesystems (NFS, network
+            homes); local disks are fastest with the default serial writes.
     """
     output_dir.mkdir(parents=True, exist_ok=True)
-    written: list[Path] = []
 
-    for filename, content in workspace.items():
-        # Skip files with empty content (optional story files)
-        if not content or not content.strip():
-            continue
+    # Skip files with empty content (optional story files). isspace() checks
+    # for blank content without allocating a stripped copy of every file
+    pending = (
+        (output_dir / filename, content)
+        for filename, content in files
+        if content and not content.isspace()
+    )
 
-        file_path = output_dir / filename
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
-        written.append(file_path)
+    if not max_workers or max_workers <= 1:
+        return [_write_text_file(file_path, content) for file_path, content in pending]
 
-    return written
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(lambda item: _write_text_file(*item), pending))
 
 
-def write_osp_meta(output_dir: Path, seed: Seed, seed_file: str) -> Path:
+def write_workspace(
+    workspace: dict[str, str],
+    output_dir: Path,
+    max_workers: Optional[int] = None,
+) -> list[Path]:
+    """Write generated workspace files to disk.
+
+    Creates the output directory if it doesn't exist.
+    Skips files with empty content (e.g., BIOGRAPHY.md for seeds without stories).
+    Returns list of written file paths.
+
+    See stream_write_workspace for max_workers.
+    """
+    return stream_write_workspace(workspace.items(), output_dir, max_workers)
+
+
+def write_osp_meta(
+    output_dir: Path,
+    seed: Seed,
+    seed_file: str,
+    now: Optional[time.struct_time] = None,
+) -> Path:
     """Write workspace metadata to .osp/meta.json.
 
     Creates the .osp directory if it doesn't exist.
@@ -141,6 +321,7 @@ def write_osp_meta(output_dir: Path, seed: Seed, seed_file: str) -> Path:
         output_dir: Path to the workspace directory.
         seed: The seed being installed.
         seed_file: The seed file name (e.g., "tabula_rasa") for updates.
+        now: Local time to record as installed_at. Defaults to the current time.
 
     Returns:
         Path to the written meta.json file.
@@ -153,14 +334,30 @@ def write_osp_meta(output_dir: Path, seed: Seed, seed_file: str) -> Path:
         seed_name=seed.meta.name,
         seed_file=seed_file,
         installed_version=seed.meta.version,
-        installed_at=datetime.now().isoformat(timespec="seconds"),
+        installed_at=time.strftime("%Y-%m-%dT%H:%M:%S", now or time.localtime()),
         osp_version=osp.__version__,
     )
 
+    # Serialize in one pass and write the bytes directly, like workspace files.
+    # Writing to a unique file beside the target and renaming keeps meta.json
+    # whole if the write is interrupted: readers see the old record or the new
+    # one, and concurrent writers never share a temp file.
     meta_path = osp_dir / "meta.json"
-    with open(meta_path, "w", encoding="utf-8") as f:
-        json.dump(meta.to_dict(), f, indent=2)
-
+    fd, tmp_name = tempfile.mkstemp(dir=osp_dir, prefix=".meta.", suffix=".tmp")
+    try:
+        try:
+            _write_all(fd, json.dumps(meta.to_dict(), indent=2).encode("utf-8"))
+        finally:
+            os.close(fd)
+        # mkstemp creates the file private; give it the mode open() would
+        os.chmod(tmp_name, _NEW_FILE_MODE)
+        os.replace(tmp_name, meta_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
     return meta_path
 
 
@@ -182,17 +379,11 @@ def init_workspace(
     # Resolve
     seed_path = resolve_seed_path(seed_name, seeds_dir)
 
-    # Load & validate
-    raw_data = load_seed_data(seed_path)
-
-    # Parse into model
-    seed = Seed.from_dict(raw_data)
-
-    # Generate
-    workspace = generate_workspace(seed)
+    # Load, validate & parse into model (memoized per file version)
+    seed = load_seed(seed_path)
 
-    # Write workspace files
-    written = write_workspace(workspace, output_dir)
+    # Generate & write workspace files, one template at a time
+    written = stream_write_workspace(iter_workspace(seed), output_dir)
 
     # Write metadata for version tracking (use seed_name as seed_file)
     write_osp_meta(output_dir, seed, seed_name)
@@ -210,13 +401,12 @@ def preview_file(
     Returns the rendered content as a string.
     """
     seed_path = resolve_seed_path(seed_name, seeds_dir)
-    raw_data = load_seed_data(seed_path)
-    seed = Seed.from_dict(raw_data)
+    cache_key = _seed_cache_key(seed_path)
+    _load_seed_cached(*cache_key)
 
     target = filename or "SOUL.md"
 
-    if target not in TEMPLATE_REGISTRY:
-        available = ", ".join(sorted(TEMPLATE_REGISTRY.keys()))
-        raise ValueError(f"Unknown file '{target}'. Available: {available}")
+    if target not in _TEMPLATE_NAMES:
+        raise ValueError(f"Unknown file '{target}'. Available: {_AVAILABLE_TEMPLATES}")
 
-    return TEMPLATE_REGISTRY[target](seed)
+    return _render_cached(*cache_key, target)
@@ -11,7 +11,9 @@ Design principles:
 
 from __future__ import annotations
 
+import functools
 import re
+import sys
 from enum import Enum
 from typing import Optional
 
@@ -29,9 +31,20 @@ class MergeStrategy(Enum):
 # === Drive Value Extraction ===
 
 # Pattern to match drive headings like "### Curiosity (0.85)" with varying whitespace
-# Also matches negative numbers and numbers > 1 for clamping
+# Also matches negative numbers and numbers > 1 for clamping. The name group
+# never captures surrounding whitespace, and the number group only accepts
+# well-formed decimals ("0.5", ".5", "5."), so every match parses
 _DRIVE_PATTERN = re.compile(
-    r"###\s*([A-Za-z_][A-Za-z0-9_\s]*?)\s*\(\s*(-?[0-9.]+)\s*\)", re.MULTILINE
+    r"###\s*([A-Za-z_][A-Za-z0-9_]*(?:\s+[A-Za-z0-9_]+)*)\s*\(\s*(-?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+))\s*\)",
+    re.MULTILINE,
+)
+
+# Headings apply_drive_values rewrites: the value group is as loose as the
+# original per-drive rewrite, so malformed numbers like "(1.2.3)" are still
+# replaced, while negative (hand-edited) values never match and stay as-is
+_DRIVE_HEADING_PATTERN = re.compile(
+    r"###\s*([A-Za-z_][A-Za-z0-9_]*(?:\s+[A-Za-z0-9_]+)*)\s*\(\s*([0-9.]+)\s*\)",
+    re.MULTILINE,
 )
 
 
@@ -52,20 +65,11 @@ def extract_drive_values(soul_md: Optional[str]) -> dict[str, float]:
     if not soul_md:
         return {}
 
-    values: dict[str, float] = {}
-
-    for match in _DRIVE_PATTERN.finditer(soul_md):
-        drive_name = match.group(1).strip()
-        try:
-            value = float(match.group(2))
-            # Clamp to valid range
-            value = max(0.0, min(1.0, value))
-            values[drive_name] = value
-        except ValueError:
-            # Skip entries with invalid float values
-            continue
-
-    return values
+    # Clamp to valid range (malformed numbers never match the pattern)
+    return {
+        sys.intern(name): max(0.0, min(1.0, float(raw)))
+        for name, raw in _DRIVE_PATTERN.findall(soul_md)
+    }
 
 
 def apply_drive_values(soul_md: Optional[str], values: dict[str, float]) -> str:
@@ -90,22 +94,35 @@ def apply_drive_values(soul_md: Optional[str], values: dict[str, float]) -> str:
     if not values:
         return soul_md
 
-    result = soul_md
+    targets = {name: f"({value})" for name, value in values.items()}
+
+    # Barely-evolved seeds usually already carry every value verbatim;
+    # return the input as-is rather than rebuilding an identical string
+    for match in _DRIVE_HEADING_PATTERN.finditer(soul_md):
+        target = targets.get(match.group(1))
+        if target is not None and not match.group(0).endswith(target):
+            break
+    else:
+        return soul_md
 
-    for drive_name, new_value in values.items():
-        # Pattern to match this specific drive
-        pattern = re.compile(
-            rf"(###\s*){re.escape(drive_name)}(\s*)\(\s*[0-9.]+\s*\)", re.MULTILINE
-        )
-        # Replace with new value, preserving whitespace style
-        result = pattern.sub(rf"\g<1>{drive_name}\g<2>({new_value})", result)
+    def _replace(match: re.Match) -> str:
+        heading = match.group(0)
+        target = targets.get(match.group(1))
+        if target is None or heading.endswith(target):
+            return heading
+        # Keep everything up to "(", preserving whitespace style
+        paren = heading.rindex("(", 0, match.start(2) - match.start())
+        return heading[:paren] + target
 
-    return result
+    # One scan over the document instead of one per drive
+    return _DRIVE_HEADING_PATTERN.sub(_replace, soul_md)
 
 
 # === SOUL.md Merge ===
 
 
+# Memoized: retries, dry runs and bulk updates often re-merge identical content
+@functools.lru_cache(maxsize=128)
 def merge_soul_md(local: Optional[str], upstream: Optional[str]) -> str:
     """Merge SOUL.md files, preserving local drive values.
 
@@ -133,6 +150,10 @@ def merge_soul_md(local: Optional[str], upstream: Optional[str]) -> str:
     if not local:
         return upstream
 
+    # No drive headings locally means nothing to carry over: skip both regex passes
+    if "###" not in local:
+        return upstream
+
     # Extract local drive values (the user's evolved personality)
     local_values = extract_drive_values(local)
 
@@ -142,10 +163,35 @@ def merge_soul_md(local: Optional[str], upstream: Optional[str]) -> str:
 
 # === Our Story Extraction ===
 
-# Pattern to match "## Our Story" section until next ## or end
-_OUR_STORY_PATTERN = re.compile(
-    r"(## Our Story\b.*?)(?=\n## |\Z)", re.DOTALL | re.MULTILINE
-)
+# The section runs from its heading until the next "\n## " heading or the end
+_OUR_STORY_HEADING = "## Our Story"
+_NEXT_SECTION = "\n## "
+
+
+def _find_our_story_span(story_md: str) -> Optional[tuple[int, int]]:
+    """Locate the "Our Story" section, excluding trailing whitespace.
+
+    Uses plain substring search rather than a lazy DOTALL regex.
+
+    Returns (start, end) offsets into story_md, or None if not found.
+    """
+    start = story_md.find(_OUR_STORY_HEADING)
+    while start != -1:
+        heading_end = start + len(_OUR_STORY_HEADING)
+        # Whole-word heading only: "## Our Storyline" doesn't count
+        if heading_end == len(story_md) or not (
+            story_md[heading_end].isalnum() or story_md[heading_end] == "_"
+        ):
+            break
+        start = story_md.find(_OUR_STORY_HEADING, start + 1)
+    else:
+        return None
+
+    end = story_md.find(_NEXT_SECTION, heading_end)
+    if end == -1:
+        end = len(story_md)
+
+    return start, start + len(story_md[start:end].rstrip())
 
 
 def extract_our_story_section(story_md: Optional[str]) -> Optional[str]:
@@ -164,9 +210,9 @@ def extract_our_story_section(story_md: Optional[str]) -> Optional[str]:
     if not story_md:
         return None
 
-    match = _OUR_STORY_PATTERN.search(story_md)
-    if match:
-        return match.group(1).rstrip()
+    span = _find_our_story_span(story_md)
+    if span:
+        return story_md[span[0]:span[1]]
 
     return None
 
@@ -203,7 +249,18 @@ def extract_skills(agents_md: Optional[str]) -> set[str]:
 
 # === AGENTS.md Merge ===
 
+# Placeholder skill rendered when a seed has no unlocked skills
+_READ_ONLY_SKILL = sys.intern("read_only")
+
+# Start of a skill line ("- `skill`")
+_SKILL_LINE_RE = re.compile(r"^- `", re.MULTILINE)
+
+# A non-blank line that isn't a list item (trailing notes after the skills)
+_TRAILING_LINE_RE = re.compile(r"^(?!-)(.*\S.*)$", re.MULTILINE)
 
+
+# Memoized: retries, dry runs and bulk updates often re-merge identical content
+@functools.lru_cache(maxsize=128)
 def merge_agents_md(local: Optional[str], upstream: Optional[str]) -> str:
     """Merge AGENTS.md files using union of skills.
 
@@ -230,49 +287,38 @@ def merge_agents_md(local: Optional[str], upstream: Optional[str]) -> str:
     if not local:
         return upstream
 
-    # Extract skills from both
-    local_skills = extract_skills(local)
-    upstream_skills = extract_skills(upstream)
-
-    # Union of all skills
-    all_skills = local_skills | upstream_skills
+    # Union of all skills, built in place on the freshly extracted local set
+    all_skills = extract_skills(local)
+    all_skills.update(extract_skills(upstream))
 
     # Remove 'read_only' if there are real skills
-    if len(all_skills) > 1 and "read_only" in all_skills:
-        all_skills.discard("read_only")
+    if len(all_skills) > 1:
+        all_skills.discard(_READ_ONLY_SKILL)
 
-    # Build output using upstream structure
-    lines: list[str] = []
-
-    # Find the header and any intro text from upstream
-    in_header = True
-    for line in upstream.split("\n"):
-        if line.startswith("- `"):
-            in_header = False
-            break
-        lines.append(line)
-
-    # Add all skills (sorted for consistency)
-    for skill in sorted(all_skills):
-        lines.append(f"- `{skill}`")
-
-    # Add any trailing content from upstream (like notes)
-    found_skills_section = False
+    # Build output using upstream structure: the header and intro text come
+    # before the first skill line; trailing content (like notes) is any
+    # non-list line after it
+    first_skill = _SKILL_LINE_RE.search(upstream)
     after_skills_content: list[str] = []
 
-    for line in upstream.split("\n"):
-        if line.startswith("- `"):
-            found_skills_section = True
-        elif found_skills_section and line.strip() and not line.startswith("-"):
-            after_skills_content.append(line)
-
-    if after_skills_content:
-        lines.append("")
-        lines.extend(after_skills_content)
+    # Split on "\n" only and strip CRs: splitlines() would also break on form
+    # feeds, U+2028 and other separators that belong to the header text
+    if first_skill is None:
+        lines = [line.rstrip("\r") for line in upstream.split("\n")]
     else:
-        lines.append("")
+        # The header ends with the newline before the first skill line
+        lines = [line.rstrip("\r") for line in upstream[: first_skill.start()].split("\n")[:-1]]
+        next_line = upstream.find("\n", first_skill.start())
+        if next_line != -1:
+            after_skills_content = _TRAILING_LINE_RE.findall(upstream, next_line + 1)
 
-    return "\n".join(lines)
+    # Header, all skills (sorted for consistency), a blank line, trailing notes
+    return "\n".join([
+        *lines,
+        *[f"- `{skill}`" for skill in sorted(all_skills)],
+        "",
+        *after_skills_content,
+    ])
 
 
 # === STORY.md Merge ===
@@ -311,11 +357,12 @@ def merge_story_md(local: Optional[str], upstream: Optional[str]) -> str:
         return upstream
 
     # Replace upstream's "Our Story" with local version
-    upstream_our_story = extract_our_story_section(upstream)
+    upstream_span = _find_our_story_span(upstream)
 
-    if upstream_our_story:
-        # Replace upstream section with local section
-        return upstream.replace(upstream_our_story, local_our_story)
+    if upstream_span:
+        # Splice the local section in at the known offsets
+        start, end = upstream_span
+        return upstream[:start] + local_our_story + upstream[end:]
     else:
         # No "Our Story" in upstream, append local version
         return upstream.rstrip() + "\n\n" + local_our_story + "\n"
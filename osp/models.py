@@ -5,11 +5,22 @@ Each model is immutable by design - seeds are data, not mutable state.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import Optional
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass(frozen=True)
+
+def _as_list(value) -> list:
+    """Return value as a list, reusing it as-is when it already is one."""
+    if isinstance(value, list):
+        return value
+    return list(value) if value else []
+
+
+@dataclass(frozen=True, **_SLOTS)
 class OSPMeta:
     """Workspace metadata for tracking seed version.
 
@@ -30,13 +41,14 @@ class OSPMeta:
         Handles version as string or float.
         Handles missing seed_file for backward compatibility.
         """
+        # Positional construction skips keyword matching; order follows the fields
         return cls(
-            seed_id=str(data["seed_id"]),
-            seed_name=str(data["seed_name"]),
-            seed_file=str(data.get("seed_file", data.get("seed_id", ""))),
-            installed_version=float(data["installed_version"]),
-            installed_at=str(data["installed_at"]),
-            osp_version=str(data["osp_version"]),
+            str(data["seed_id"]),
+            str(data["seed_name"]),
+            str(data.get("seed_file", data.get("seed_id", ""))),
+            float(data["installed_version"]),
+            str(data["installed_at"]),
+            str(data["osp_version"]),
         )
 
     def to_dict(self) -> dict:
@@ -51,7 +63,7 @@ class OSPMeta:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Meta:
     """Seed identity metadata."""
 
@@ -61,7 +73,7 @@ class Meta:
     created_at: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Nucleus:
     """Layer 1: Immutable core - drives and prime directives."""
 
@@ -69,7 +81,7 @@ class Nucleus:
     prime_directives: list[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Persona:
     """Layer 2: Evolving state - mission, memory, skills."""
 
@@ -79,7 +91,7 @@ class Persona:
     unlocked_skills: list[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Pulse:
     """Layer 3: Expression style - tone, format, quirks."""
 
@@ -88,7 +100,7 @@ class Pulse:
     quirks: list[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Story:
     """Optional pre-written story content for instant-ready characters.
 
@@ -106,7 +118,7 @@ class Story:
     speech_examples: Optional[list[str]] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Seed:
     """Complete soul seed - the DNA of an AI agent."""
 
@@ -120,6 +132,9 @@ class Seed:
     def from_dict(cls, data: dict) -> Seed:
         """Create a Seed from a raw YAML dictionary.
 
+        Lists and dicts from `data` are reused rather than copied, so the
+        caller must not mutate `data` after construction.
+
         Raises:
             KeyError: If required fields are missing.
             TypeError: If field types are incorrect.
@@ -131,9 +146,10 @@ class Seed:
             created_at=str(data["meta"]["created_at"]),
         )
 
+        drives = data["nucleus"]["drives"]
         nucleus = Nucleus(
-            drives=dict(data["nucleus"]["drives"]),
-            prime_directives=list(data["nucleus"]["prime_directives"]),
+            drives=drives if isinstance(drives, dict) else dict(drives),
+            prime_directives=_as_list(data["nucleus"]["prime_directives"]),
         )
 
         persona_data = data["persona"]
@@ -141,28 +157,30 @@ class Seed:
             current_mission=persona_data.get("current_mission"),
             mission_lock=bool(persona_data.get("mission_lock", False)),
             memory_summary=str(persona_data.get("memory_summary", "")),
-            unlocked_skills=list(persona_data.get("unlocked_skills", [])),
+            unlocked_skills=_as_list(persona_data.get("unlocked_skills")),
         )
 
         pulse_data = data["pulse"]
         pulse = Pulse(
-            tone=list(pulse_data.get("tone", [])),
+            tone=_as_list(pulse_data.get("tone")),
             formatting_preference=str(pulse_data.get("formatting_preference", "markdown")),
-            quirks=list(pulse_data.get("quirks", [])),
+            quirks=_as_list(pulse_data.get("quirks")),
         )
 
         # Parse optional story
         story = None
         if "story" in data and data["story"]:
             story_data = data["story"]
+            memories = story_data.get("memories")
+            speech_examples = story_data.get("speech_examples")
             story = Story(
                 age=story_data.get("age"),
                 location=story_data.get("location"),
                 occupation=story_data.get("occupation"),
                 biography=story_data.get("biography"),
                 daily_routine=story_data.get("daily_routine"),
-                memories=list(story_data.get("memories", [])) if story_data.get("memories") else None,
-                speech_examples=list(story_data.get("speech_examples", [])) if story_data.get("speech_examples") else None,
+                memories=_as_list(memories) if memories else None,
+                speech_examples=_as_list(speech_examples) if speech_examples else None,
             )
 
         return cls(meta=meta, nucleus=nucleus, persona=persona, pulse=pulse, story=story)
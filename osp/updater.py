@@ -7,18 +7,19 @@ Phase 3: Update pipeline (backup, file strategies, update_workspace).
 from __future__ import annotations
 
 import json
+import os
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
 import osp
 
 from osp.merger import MergeStrategy, merge_agents_md, merge_soul_md, merge_story_md
 from osp.models import OSPMeta, Seed
-from osp.generator import generate_workspace, resolve_seed_path
-from osp.validator import load_seed_data
+from osp.generator import iter_workspace, load_seed, resolve_seed_path, write_osp_meta
 
 
 # === Data Structures ===
@@ -60,6 +61,15 @@ FILE_STRATEGIES: dict[str, MergeStrategy] = {
     "BOOT.md": MergeStrategy.SMART_MERGE,
 }
 
+# What a dry run reports for each strategy: (action, details)
+_DRY_RUN_ACTIONS: dict[MergeStrategy, tuple[str, str]] = {
+    MergeStrategy.OVERWRITE: ("overwritten", "Would replace with upstream content"),
+    MergeStrategy.PRESERVE: ("preserved", "Would preserve local content"),
+    MergeStrategy.SMART_MERGE: ("smart_merged", "Would smart merge"),
+    MergeStrategy.SECTION_MERGE: ("section_merged", "Would section merge"),
+    MergeStrategy.UNION_MERGE: ("union_merged", "Would union merge"),
+}
+
 
 def get_meta_path(workspace: Path) -> Path:
     """Get the path to .osp/meta.json for a workspace.
@@ -82,16 +92,11 @@ def read_osp_meta(workspace: Path) -> Optional[OSPMeta]:
     Returns:
         OSPMeta if valid metadata exists, None otherwise.
     """
-    meta_path = get_meta_path(workspace)
-
-    if not meta_path.exists():
-        return None
-
     try:
-        with open(meta_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        # One read, no separate exists() probe; json.loads decodes the bytes
+        data = json.loads(get_meta_path(workspace).read_bytes())
         return OSPMeta.from_dict(data)
-    except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+    except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError, ValueError):
         return None
 
 
@@ -107,30 +112,93 @@ def get_file_strategy(filename: str) -> MergeStrategy:
     return FILE_STRATEGIES.get(filename, MergeStrategy.PRESERVE)
 
 
-def create_backup(workspace: Path) -> Path:
+def _iter_markdown_files(workspace: Path) -> Iterator[os.DirEntry]:
+    """Yield the top-level .md files of a workspace.
+
+    os.scandir reports file types from the directory listing itself, so no
+    per-entry stat() or Path object is needed.
+    """
+    with os.scandir(workspace) as entries:
+        for entry in entries:
+            if entry.name.endswith(".md") and entry.is_file():
+                yield entry
+
+
+def create_backup(workspace: Path, now: Optional[time.struct_time] = None) -> Path:
     """Create a backup of all .md files in the workspace.
 
     Creates a timestamped backup directory under .osp/backups/.
 
     Args:
         workspace: Path to the workspace directory.
+        now: Local time to name the backup after. Defaults to the current time.
 
     Returns:
         Path to the created backup directory.
     """
     # Create timestamp for backup directory name
-    timestamp = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
+    timestamp = time.strftime("%Y-%m-%dT%H-%M-%S", now or time.localtime())
     backup_dir = workspace / ".osp" / "backups" / timestamp
     backup_dir.mkdir(parents=True, exist_ok=True)
 
     # Copy all .md files to backup
-    for md_file in workspace.glob("*.md"):
-        backup_file = backup_dir / md_file.name
-        shutil.copy2(md_file, backup_file)
+    for entry in _iter_markdown_files(workspace):
+        shutil.copy2(entry.path, backup_dir / entry.name)
 
     return backup_dir
 
 
+def _read_local(file_path: Path) -> tuple[Optional[bytes], Optional[str]]:
+    """Read a workspace file as (raw bytes, text), or (None, None) if missing.
+
+    The text matches read_text(): UTF-8 with universal newlines.
+    """
+    try:
+        raw = file_path.read_bytes()
+    except FileNotFoundError:
+        return None, None
+    text = raw.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return raw, text
+
+
+def _write_if_changed(file_path: Path, content: str, local_raw: Optional[bytes]) -> None:
+    """Write merged content as UTF-8 unless it matches the bytes already read.
+
+    local_raw is the file's current content as returned by _read_local (None
+    when the file is missing), so no second read is needed.
+    """
+    data = content.encode("utf-8")
+    if data != local_raw:
+        file_path.write_bytes(data)
+
+
+def _overwrite_file(file_path: Path, content: str) -> None:
+    """Replace a seed-owned file with upstream content, skipping identical bytes.
+
+    The current content has not been read yet; a size mismatch proves the file
+    differs, so it is only read back when the sizes agree.
+    """
+    data = content.encode("utf-8")
+    try:
+        if os.stat(file_path).st_size == len(data) and file_path.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+    file_path.write_bytes(data)
+
+
+# Strategies that merge with the local text: strategy -> (merge, action, details).
+# OVERWRITE and PRESERVE never need the local text, so update_file handles
+# them before reading anything.
+_STRATEGY_DISPATCH: dict[MergeStrategy, tuple[Callable[[Optional[str], str], str], str, str]] = {
+    MergeStrategy.SMART_MERGE: (merge_soul_md, "smart_merged", "Smart merge (preserved local drive values)"),
+    MergeStrategy.SECTION_MERGE: (merge_story_md, "section_merged", "Section merge (preserved 'Our Story' section)"),
+    MergeStrategy.UNION_MERGE: (merge_agents_md, "union_merged", "Union merge (combined skills)"),
+}
+
+
 def update_file(
     workspace: Path,
     filename: str,
@@ -158,96 +226,72 @@ def update_file(
             details="Empty upstream content",
         )
 
-    # Get local content if exists
-    local_content: Optional[str] = None
-    if file_path.exists():
-        local_content = file_path.read_text(encoding="utf-8")
-
     # Apply strategy
-    if strategy == MergeStrategy.OVERWRITE:
-        file_path.write_text(upstream_content, encoding="utf-8")
+    handler = _STRATEGY_DISPATCH.get(strategy)
+    if handler is not None:
+        # Get local content if exists; the raw bytes let identical writes be skipped
+        local_raw, local_content = _read_local(file_path)
+        merge, action, details = handler
+        _write_if_changed(file_path, merge(local_content, upstream_content), local_raw)
+        return FileChange(filename=filename, action=action, details=details)
+
+    if strategy is MergeStrategy.OVERWRITE:
+        _overwrite_file(file_path, upstream_content)
         return FileChange(
             filename=filename,
             action="overwritten",
             details="Replaced with upstream content",
         )
 
-    elif strategy == MergeStrategy.PRESERVE:
-        if local_content is None:
+    if strategy is MergeStrategy.PRESERVE:
+        if not file_path.exists():
             # No local file, create it with upstream content
-            file_path.write_text(upstream_content, encoding="utf-8")
+            file_path.write_bytes(upstream_content.encode("utf-8"))
             return FileChange(
                 filename=filename,
                 action="overwritten",
                 details="Created with upstream (no local file)",
             )
-        else:
-            # Keep local content unchanged
-            return FileChange(
-                filename=filename,
-                action="preserved",
-                details="Local content preserved",
-            )
-
-    elif strategy == MergeStrategy.SMART_MERGE:
-        merged = merge_soul_md(local_content, upstream_content)
-        file_path.write_text(merged, encoding="utf-8")
+        # Keep local content unchanged
         return FileChange(
             filename=filename,
-            action="smart_merged",
-            details="Smart merge (preserved local drive values)",
+            action="preserved",
+            details="Local content preserved",
         )
 
-    elif strategy == MergeStrategy.SECTION_MERGE:
-        merged = merge_story_md(local_content, upstream_content)
-        file_path.write_text(merged, encoding="utf-8")
-        return FileChange(
-            filename=filename,
-            action="section_merged",
-            details="Section merge (preserved 'Our Story' section)",
-        )
+    # Default to preserve for unknown strategies
+    return FileChange(
+        filename=filename,
+        action="preserved",
+        details=f"Unknown strategy: {strategy}",
+    )
 
-    elif strategy == MergeStrategy.UNION_MERGE:
-        merged = merge_agents_md(local_content, upstream_content)
-        file_path.write_text(merged, encoding="utf-8")
-        return FileChange(
-            filename=filename,
-            action="union_merged",
-            details="Union merge (combined skills)",
-        )
 
-    else:
-        # Default to preserve for unknown strategies
-        return FileChange(
-            filename=filename,
-            action="preserved",
-            details=f"Unknown strategy: {strategy}",
-        )
+def _dry_run_change(filename: str, strategy: MergeStrategy) -> FileChange:
+    """Describe what update_file would do with a file, without touching it."""
+    dry_run_action = _DRY_RUN_ACTIONS.get(strategy)
+    if dry_run_action is None:
+        return FileChange(filename=filename, action="preserved", details=f"Unknown strategy: {strategy}")
+    action, details = dry_run_action
+    return FileChange(filename=filename, action=action, details=details)
 
 
-def write_updated_meta(workspace: Path, seed: Seed, seed_file: str) -> None:
+def write_updated_meta(
+    workspace: Path,
+    seed: Seed,
+    seed_file: str,
+    now: Optional[time.struct_time] = None,
+) -> None:
     """Write updated metadata after a successful update.
 
     Args:
         workspace: Path to the workspace directory.
         seed: The seed that was updated to.
         seed_file: The seed file name for future updates.
+        now: Local time to record as installed_at. Defaults to the current time.
     """
-    osp_dir = workspace / ".osp"
-    osp_dir.mkdir(parents=True, exist_ok=True)
-
-    meta = OSPMeta(
-        seed_id=seed.meta.seed_id,
-        seed_name=seed.meta.name,
-        seed_file=seed_file,
-        installed_version=seed.meta.version,
-        installed_at=datetime.now().isoformat(timespec="seconds"),
-        osp_version=osp.__version__,
-    )
-
-    meta_path = osp_dir / "meta.json"
-    with open(meta_path, "w", encoding="utf-8") as f:
-        json.dump(meta.to_dict(), f, indent=2)
+    # Same record as a fresh install, with a new timestamp
+    write_osp_meta(workspace, seed, seed_file, now)
 
 
 def update_workspace(
@@ -255,13 +299,15 @@ def update_workspace(
     seed_name: Optional[str] = None,
     dry_run: bool = False,
     force: bool = False,
+    max_workers: Optional[int] = None,
 ) -> UpdateResult:
     """Update a workspace with the latest seed version.
 
     Pipeline:
     1. Read local meta
     2. Load upstream seed
-    3. Compare versions
+    3. Compare versions (stop early if already up to date), then render
+       every upstream file before the workspace is touched
     4. Create backup (if not dry_run)
     5. Apply file strategies
     6. Update meta
@@ -271,13 +317,17 @@ def update_workspace(
         workspace: Path to the workspace directory.
         seed_name: Optional seed name to update to. If None, uses meta's seed_id.
         dry_run: If True, simulate update without modifying files.
-        force: If True, allow update even without existing meta.
+        force: If True, allow update even without existing meta, and
+            re-apply files even when the workspace is already up to date.
+        max_workers: If greater than 1, merge and write files on a thread
+            pool of this size. Files are independent, so this overlaps their
+            I/O; the default applies them serially. Dry runs are always serial.
 
     Returns:
         UpdateResult with success status, changes, and any conflicts.
     """
     conflicts: list[str] = []
-    changes: list[FileChange] = []
+    changes: tuple[FileChange, ...]
     backup_path: Optional[str] = None
 
     # Step 1: Read local meta
@@ -312,8 +362,7 @@ def update_workspace(
     # Step 2: Load upstream seed
     try:
         seed_path = resolve_seed_path(target_seed_name)
-        raw_data = load_seed_data(seed_path)
-        upstream_seed = Seed.from_dict(raw_data)
+        upstream_seed = load_seed(seed_path)
     except FileNotFoundError:
         return UpdateResult(
             success=False,
@@ -336,57 +385,64 @@ def update_workspace(
     from_version = local_meta.installed_version if local_meta else 0.0
     to_version = upstream_seed.meta.version
 
-    # Step 3: Generate upstream workspace content
-    upstream_workspace = generate_workspace(upstream_seed)
+    # Nothing to apply: same seed at the same version, rendered by the same
+    # OSP release (template changes ship with OSP, so upgrades still re-apply)
+    if (
+        not force
+        and local_meta is not None
+        and local_meta.seed_id == upstream_seed.meta.seed_id
+        and from_version == to_version
+        and local_meta.osp_version == osp.__version__
+    ):
+        return UpdateResult(
+            success=True,
+            from_version=from_version,
+            to_version=to_version,
+            changes=(),
+            backup_path=None,
+            conflicts=(),
+        )
+
+    # Step 3: Render every upstream file up front, so a failing renderer
+    # leaves the workspace (and its meta) exactly as it was
+    strategy_for = FILE_STRATEGIES.get
+    planned = [
+        (filename, upstream_content, strategy_for(filename, MergeStrategy.PRESERVE))
+        for filename, upstream_content in iter_workspace(upstream_seed)
+    ]
+
+    # One clock read names the backup and stamps the meta, so they match
+    now = time.localtime()
 
     # Step 4: Create backup (if not dry_run)
     if not dry_run and workspace.exists():
-        # Check if there are any .md files to backup
-        if list(workspace.glob("*.md")):
-            backup_dir = create_backup(workspace)
+        # Check if there are any .md files to backup (stops at the first one)
+        if any(_iter_markdown_files(workspace)):
+            backup_dir = create_backup(workspace, now)
             backup_path = str(backup_dir)
 
     # Step 5: Apply file strategies
-    for filename, upstream_content in upstream_workspace.items():
-        strategy = get_file_strategy(filename)
-
-        if dry_run:
-            # In dry run, just record what would happen
-            if strategy == MergeStrategy.OVERWRITE:
-                action = "overwritten"
-                details = "Would replace with upstream content"
-            elif strategy == MergeStrategy.PRESERVE:
-                action = "preserved"
-                details = "Would preserve local content"
-            elif strategy == MergeStrategy.SMART_MERGE:
-                action = "smart_merged"
-                details = "Would smart merge"
-            elif strategy == MergeStrategy.SECTION_MERGE:
-                action = "section_merged"
-                details = "Would section merge"
-            elif strategy == MergeStrategy.UNION_MERGE:
-                action = "union_merged"
-                details = "Would union merge"
-            else:
-                action = "preserved"
-                details = f"Unknown strategy: {strategy}"
-
-            changes.append(FileChange(filename=filename, action=action, details=details))
-        else:
-            # Actually update the file
-            change = update_file(workspace, filename, upstream_content, strategy)
-            changes.append(change)
+    if dry_run:
+        # In dry run, just record what would happen
+        changes = tuple(_dry_run_change(filename, strategy) for filename, _, strategy in planned)
+    elif not max_workers or max_workers <= 1:
+        changes = tuple(update_file(workspace, *item) for item in planned)
+    else:
+        # Each file is read, merged and written independently; map() keeps
+        # the change records in file order
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            changes = tuple(pool.map(lambda item: update_file(workspace, *item), planned))
 
     # Step 6: Update meta (if not dry_run)
     if not dry_run:
-        write_updated_meta(workspace, upstream_seed, target_seed_name)
+        write_updated_meta(workspace, upstream_seed, target_seed_name, now)
 
     # Step 7: Return result
     return UpdateResult(
         success=True,
         from_version=from_version,
         to_version=to_version,
-        changes=tuple(changes),
+        changes=changes,
         backup_path=backup_path,
         conflicts=tuple(conflicts),
     )
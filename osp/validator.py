@@ -5,12 +5,18 @@ Extracted from the original test_seeds.py into a reusable module.
 
 from __future__ import annotations
 
+import copy
+import functools
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Union
+from typing import Iterator, Optional, Union
 
 import yaml
 
+# libyaml's C loader is an order of magnitude faster; fall back if unavailable
+SeedLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # The law every soul must obey
 SOUL_SCHEMA = {
     "required_roots": ["meta", "nucleus", "persona", "pulse"],
@@ -20,6 +26,17 @@ SOUL_SCHEMA = {
     "pulse": ["tone", "formatting_preference"],
 }
 
+# Set views of the schema: a valid section passes one C-level subset test,
+# and the ordered lists above are only walked to word the errors
+_REQUIRED_SETS = {key: frozenset(fields) for key, fields in SOUL_SCHEMA.items()}
+
+
+def _missing(section: dict, key: str, message: str) -> list[str]:
+    """Return one error per schema field of `key` absent from `section`."""
+    if _REQUIRED_SETS[key] <= section.keys():
+        return []
+    return [message.format(fld) for fld in SOUL_SCHEMA[key] if fld not in section]
+
 
 @dataclass(frozen=True)
 class ValidationResult:
@@ -44,21 +61,15 @@ def validate_structure(data: dict, filename: str = "<unknown>") -> list[str]:
         return [f"Expected a YAML mapping, got {type(data).__name__}"]
 
     # Check root sections
-    for root in SOUL_SCHEMA["required_roots"]:
-        if root not in data:
-            errors.append(f"Missing root section: '{root}'")
+    errors.extend(_missing(data, "required_roots", "Missing root section: '{}'"))
 
     # Check meta fields
     if "meta" in data and isinstance(data["meta"], dict):
-        for fld in SOUL_SCHEMA["meta"]:
-            if fld not in data["meta"]:
-                errors.append(f"Missing field in meta: '{fld}'")
+        errors.extend(_missing(data["meta"], "meta", "Missing field in meta: '{}'"))
 
     # Check Nucleus (Layer 1)
     if "nucleus" in data and isinstance(data["nucleus"], dict):
-        for fld in SOUL_SCHEMA["nucleus"]:
-            if fld not in data["nucleus"]:
-                errors.append(f"Missing field in nucleus: '{fld}'")
+        errors.extend(_missing(data["nucleus"], "nucleus", "Missing field in nucleus: '{}'"))
 
         drives = data["nucleus"].get("drives")
         if isinstance(drives, dict):
@@ -76,15 +87,11 @@ def validate_structure(data: dict, filename: str = "<unknown>") -> list[str]:
 
     # Check Persona (Layer 2)
     if "persona" in data and isinstance(data["persona"], dict):
-        for fld in SOUL_SCHEMA["persona"]:
-            if fld not in data["persona"]:
-                errors.append(f"Missing field in persona: '{fld}'")
+        errors.extend(_missing(data["persona"], "persona", "Missing field in persona: '{}'"))
 
     # Check Pulse (Layer 3)
     if "pulse" in data and isinstance(data["pulse"], dict):
-        for fld in SOUL_SCHEMA["pulse"]:
-            if fld not in data["pulse"]:
-                errors.append(f"Missing field in pulse: '{fld}'")
+        errors.extend(_missing(data["pulse"], "pulse", "Missing field in pulse: '{}'"))
 
     return errors
 
@@ -106,8 +113,9 @@ def validate_file(path: Union[str, Path]) -> ValidationResult:
         )
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        # Bytes go straight to the loader, which detects the encoding itself
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=SeedLoader)
     except yaml.YAMLError as exc:
         return ValidationResult(
             path=str_path, errors=(f"Invalid YAML syntax: {exc}",)
@@ -120,27 +128,185 @@ def validate_file(path: Union[str, Path]) -> ValidationResult:
     return ValidationResult(path=str_path, errors=tuple(errs))
 
 
-def load_seed_data(path: Union[str, Path]) -> dict:
-    """Load and return raw YAML data from a seed file.
+# === Event-Stream Fast Path ===
 
-    Raises:
-        FileNotFoundError: If the file doesn't exist.
-        yaml.YAMLError: If YAML parsing fails.
-        ValueError: If the file is empty or invalid.
+# Plain drive values whose float() reading matches YAML's own resolution;
+# anything fancier (exponents, underscores, sexagesimal) takes the slow path
+_PLAIN_NUMBER = re.compile(r"[-+]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)\Z")
+
+_STR_TAG = "tag:yaml.org,2002:str"
+_RESOLVER = yaml.resolver.Resolver()
+_CONSTRUCTOR = yaml.constructor.SafeConstructor()
+
+
+def _scalar_text(event: yaml.Event) -> Optional[str]:
+    """Return a scalar's text if yaml.load would accept it, else None.
+
+    Tags, anchors and aliases are left to the full loader. Plain scalars
+    that resolve to another type (timestamps, ints, ...) are built once with
+    the loader's own constructor, since some of them fail to construct.
+    """
+    if not isinstance(event, yaml.ScalarEvent) or event.tag is not None or event.anchor is not None:
+        return None
+    value = event.value
+    if event.style is None and value:
+        tag = _RESOLVER.resolve(yaml.ScalarNode, value, (True, False))
+        if tag != _STR_TAG:
+            constructor = _CONSTRUCTOR.yaml_constructors.get(tag)
+            if constructor is None or tag == "tag:yaml.org,2002:merge":
+                return None
+            try:
+                constructor(_CONSTRUCTOR, yaml.ScalarNode(tag, value))
+            except Exception:
+                return None
+    return value
+
+
+def _is_plain_mapping(event: yaml.Event) -> bool:
+    return isinstance(event, yaml.MappingStartEvent) and event.tag is None and event.anchor is None
+
+
+def _skip_node(events: Iterator[yaml.Event], event: yaml.Event) -> bool:
+    """Consume the rest of the node that starts with `event`.
+
+    Returns False if the node holds anything _scalar_text would reject.
+    """
+    depth = 0
+    while True:
+        if isinstance(event, yaml.CollectionStartEvent):
+            if event.tag is not None or event.anchor is not None:
+                return False
+            depth += 1
+        elif isinstance(event, yaml.CollectionEndEvent):
+            depth -= 1
+        elif _scalar_text(event) is None:
+            return False
+        if not depth:
+            return True
+        event = next(events)
+
+
+def _drives_in_range(events: Iterator[yaml.Event]) -> bool:
+    """Check a drives mapping's values without building the mapping."""
+    while True:
+        key = next(events)
+        if isinstance(key, yaml.MappingEndEvent):
+            return True
+        value = _scalar_text(next(events))
+        if _scalar_text(key) is None or value is None:
+            return False
+        if not _PLAIN_NUMBER.match(value) or not 0.0 <= float(value) <= 1.0:
+            return False
+
+
+def _scan_is_valid_seed(events: Iterator[yaml.Event]) -> bool:
+    """Return True only if the event stream is certainly a valid seed.
+
+    Tracks just the root sections and their keys, so no Python objects are
+    built for the values. False means "not proven", not "invalid".
+    """
+    if not isinstance(next(events), yaml.StreamStartEvent):
+        return False
+    if not isinstance(next(events), yaml.DocumentStartEvent) or not _is_plain_mapping(next(events)):
+        return False
+
+    found: dict[str, set[str]] = {}
+    while True:
+        event = next(events)
+        if isinstance(event, yaml.MappingEndEvent):
+            break
+        root = _scalar_text(event)
+        value = next(events)
+        if root is None:
+            return False
+        if root not in _REQUIRED_SETS["required_roots"]:
+            if not _skip_node(events, value):
+                return False
+            continue
+        # A repeated section would replace the first one on load
+        if root in found or not _is_plain_mapping(value):
+            return False
+
+        keys = found[root] = set()
+        while True:
+            event = next(events)
+            if isinstance(event, yaml.MappingEndEvent):
+                break
+            key = _scalar_text(event)
+            value = next(events)
+            if key is None:
+                return False
+            keys.add(key)
+            if root == "nucleus" and key == "drives":
+                if not _is_plain_mapping(value) or not _drives_in_range(events):
+                    return False
+            elif not _skip_node(events, value):
+                return False
+
+    # One document only, exactly as yaml.load requires
+    if not isinstance(next(events), yaml.DocumentEndEvent) or not isinstance(next(events), yaml.StreamEndEvent):
+        return False
+    return found.keys() == _REQUIRED_SETS["required_roots"] and all(
+        _REQUIRED_SETS[root] <= keys for root, keys in found.items()
+    )
+
+
+def validate_file_fast(path: Union[str, Path]) -> ValidationResult:
+    """Validate a YAML seed file, skipping object construction when possible.
+
+    Scans the parser's event stream for the schema's keys and drive ranges.
+    Anything it cannot prove valid goes through validate_file, so errors
+    and their messages are identical.
     """
     path = Path(path)
 
-    if not path.exists():
-        raise FileNotFoundError(f"Seed file not found: {path}")
+    if path.suffix in (".yaml", ".yml"):
+        try:
+            with open(path, "rb") as f:
+                if _scan_is_valid_seed(iter(yaml.parse(f, Loader=SeedLoader))):
+                    return ValidationResult(path=str(path))
+        except (OSError, StopIteration, yaml.YAMLError):
+            pass
+
+    return validate_file(path)
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+
+# === Seed Loading ===
+
+
+@functools.lru_cache(maxsize=32)
+def _load_seed_data_cached(path_str: str, mtime_ns: int, size: int) -> dict:
+    """Parse and validate a seed file; the stat fields key out stale entries."""
+    with open(path_str, "rb") as f:
+        data = yaml.load(f, Loader=SeedLoader)
 
     if not data:
-        raise ValueError(f"Seed file is empty: {path}")
+        raise ValueError(f"Seed file is empty: {path_str}")
 
-    errors = validate_structure(data, str(path))
+    errors = validate_structure(data, path_str)
     if errors:
-        raise ValueError(f"Seed validation failed for {path}:\n" + "\n".join(f"  - {e}" for e in errors))
+        raise ValueError(f"Seed validation failed for {path_str}:\n" + "\n".join(f"  - {e}" for e in errors))
 
     return data
+
+
+def load_seed_data(path: Union[str, Path]) -> dict:
+    """Load and return raw YAML data from a seed file.
+
+    Parsed results are memoized per (path, mtime, size), so repeated loads
+    of an unchanged file skip parsing and validation. Each call returns a
+    deep copy that the caller is free to mutate.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        yaml.YAMLError: If YAML parsing fails.
+        ValueError: If the file is empty or invalid.
+    """
+    path = Path(path)
+
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Seed file not found: {path}") from None
+
+    return copy.deepcopy(_load_seed_data_cached(str(path), st.st_mtime_ns, st.st_size))
@@ -3,24 +3,72 @@
 Uses Click's CliRunner for isolated command testing.
 """
 
+import os
+import shutil
+
+import click
 import pytest
 from pathlib import Path
 
-from click.testing import CliRunner
+from click.testing import CliRunner, Result
 
 from osp.cli import main
 
+SEEDS_DIR = Path(__file__).parent.parent / "seeds"
+with os.scandir(SEEDS_DIR) as _entries:
+    BUILT_IN_SEEDS = sorted(entry.path for entry in _entries if entry.name.endswith(".yaml"))
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def runner() -> CliRunner:
     return CliRunner()
 
 
+def invoke_fast(capsys: pytest.CaptureFixture[str], args: list[str]) -> tuple[int, str]:
+    """Run the CLI in-process, without CliRunner's stream isolation.
+
+    For read-only commands; returns (exit_code, stdout). Errors are shown
+    and mapped to exit codes the way standalone mode would.
+    """
+    try:
+        exit_code = main.main(args=args, standalone_mode=False, prog_name="osp") or 0
+    except click.ClickException as exc:
+        exc.show()
+        exit_code = exc.exit_code
+    return exit_code, capsys.readouterr().out
+
+
+@pytest.fixture(scope="session")
+def _base_workspace(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A tabula_rasa workspace initialized once per test session."""
+    workspace = tmp_path_factory.mktemp("base") / "ws"
+    result = CliRunner().invoke(main, ["init", "--seed", "tabula_rasa", "--workspace", str(workspace)])
+    assert result.exit_code == 0, result.output
+    return workspace
+
+
+@pytest.fixture
+def workspace(_base_workspace: Path, tmp_path: Path) -> Path:
+    """A private copy of the initialized workspace, free to modify."""
+    return Path(shutil.copytree(_base_workspace, tmp_path / "ws"))
+
+
+@pytest.fixture(scope="module")
+def dry_run(
+    runner: CliRunner, _base_workspace: Path, tmp_path_factory: pytest.TempPathFactory
+) -> tuple[Result, Path, str]:
+    """One forced dry run shared by the dry-run tests; it is read-only by definition."""
+    workspace = Path(shutil.copytree(_base_workspace, tmp_path_factory.mktemp("dry_run") / "ws"))
+    soul_before = (workspace / "SOUL.md").read_text()
+    result = runner.invoke(main, ["update", "--workspace", str(workspace), "--dry-run", "--force"])
+    return result, workspace, soul_before
+
+
 class TestVersion:
-    def test_shows_version(self, runner: CliRunner) -> None:
-        result = runner.invoke(main, ["--version"])
-        assert result.exit_code == 0
-        assert "0.2.0" in result.output
+    def test_shows_version(self, capsys: pytest.CaptureFixture[str]) -> None:
+        exit_code, output = invoke_fast(capsys, ["--version"])
+        assert exit_code == 0
+        assert "0.2.0" in output
 
 
 class TestInit:
@@ -38,7 +86,8 @@ class TestInit:
         expected_files = {"SOUL.md", "IDENTITY.md", "AGENTS.md", "MEMORY.md",
                           "HEARTBEAT.md", "EVOLUTION_LOG.md", "BOOTSTRAP.md", "BOOT.md", "USER.md"}
         # Only check .md files (exclude .osp directory)
-        actual_files = {f.name for f in workspace.iterdir() if f.suffix == ".md"}
+        with os.scandir(workspace) as entries:
+            actual_files = {entry.name for entry in entries if entry.name.endswith(".md")}
         assert expected_files == actual_files
 
     def test_creates_osp_meta_file(self, runner: CliRunner, tmp_path: Path) -> None:
@@ -54,51 +103,51 @@ class TestInit:
         assert result.exit_code != 0
         assert "not found" in result.output
 
-    def test_all_seeds_generate_successfully(self, runner: CliRunner, tmp_path: Path) -> None:
-        for seed_name in ["tabula_rasa", "glitch", "sentinel", "10x_engineer"]:
-            workspace = tmp_path / seed_name
-            result = runner.invoke(main, ["init", "--seed", seed_name, "--workspace", str(workspace)])
-            assert result.exit_code == 0, f"Failed for {seed_name}: {result.output}"
+    @pytest.mark.parametrize("seed_name", ["tabula_rasa", "glitch", "sentinel", "10x_engineer"])
+    def test_all_seeds_generate_successfully(self, runner: CliRunner, tmp_path: Path, seed_name: str) -> None:
+        workspace = tmp_path / seed_name
+        result = runner.invoke(main, ["init", "--seed", seed_name, "--workspace", str(workspace)])
+        assert result.exit_code == 0, f"Failed for {seed_name}: {result.output}"
 
 
 class TestList:
-    def test_lists_seeds(self, runner: CliRunner) -> None:
-        result = runner.invoke(main, ["list"])
-        assert result.exit_code == 0
-        assert "tabula_rasa" in result.output
-        assert "glitch" in result.output
-        assert "sentinel" in result.output
-        assert "10x_engineer" in result.output
+    def test_lists_seeds(self, capsys: pytest.CaptureFixture[str]) -> None:
+        exit_code, output = invoke_fast(capsys, ["list"])
+        assert exit_code == 0
+        assert "tabula_rasa" in output
+        assert "glitch" in output
+        assert "sentinel" in output
+        assert "10x_engineer" in output
 
-    def test_shows_display_names(self, runner: CliRunner) -> None:
-        result = runner.invoke(main, ["list"])
-        assert "The Observer" in result.output
-        assert "The Glitch" in result.output
+    def test_shows_display_names(self, capsys: pytest.CaptureFixture[str]) -> None:
+        exit_code, output = invoke_fast(capsys, ["list"])
+        assert "The Observer" in output
+        assert "The Glitch" in output
 
 
 class TestPreview:
-    def test_preview_default(self, runner: CliRunner) -> None:
-        result = runner.invoke(main, ["preview", "--seed", "tabula_rasa"])
-        assert result.exit_code == 0
-        assert "Core Drives" in result.output
+    def test_preview_default(self, capsys: pytest.CaptureFixture[str]) -> None:
+        exit_code, output = invoke_fast(capsys, ["preview", "--seed", "tabula_rasa"])
+        assert exit_code == 0
+        assert "Core Drives" in output
 
-    def test_preview_specific_file(self, runner: CliRunner) -> None:
-        result = runner.invoke(main, ["preview", "--seed", "glitch", "--file", "IDENTITY.md"])
-        assert result.exit_code == 0
-        assert "The Glitch" in result.output
+    def test_preview_specific_file(self, capsys: pytest.CaptureFixture[str]) -> None:
+        exit_code, output = invoke_fast(capsys, ["preview", "--seed", "glitch", "--file", "IDENTITY.md"])
+        assert exit_code == 0
+        assert "The Glitch" in output
 
-    def test_preview_invalid_file(self, runner: CliRunner) -> None:
-        result = runner.invoke(main, ["preview", "--seed", "tabula_rasa", "--file", "INVALID.md"])
-        assert result.exit_code != 0
+    def test_preview_invalid_file(self, capsys: pytest.CaptureFixture[str]) -> None:
+        exit_code, output = invoke_fast(capsys, ["preview", "--seed", "tabula_rasa", "--file", "INVALID.md"])
+        assert exit_code != 0
 
-    def test_preview_invalid_seed(self, runner: CliRunner) -> None:
-        result = runner.invoke(main, ["preview", "--seed", "nonexistent"])
-        assert result.exit_code != 0
+    def test_preview_invalid_seed(self, capsys: pytest.CaptureFixture[str]) -> None:
+        exit_code, output = invoke_fast(capsys, ["preview", "--seed", "nonexistent"])
+        assert exit_code != 0
 
 
 class TestValidate:
     def test_valid_seed(self, runner: CliRunner) -> None:
-        seed_path = str(Path(__file__).parent.parent / "seeds" / "tabula_rasa.yaml")
+        seed_path = str(SEEDS_DIR / "tabula_rasa.yaml")
         result = runner.invoke(main, ["validate", seed_path])
         assert result.exit_code == 0
         assert "Valid" in result.output
@@ -109,32 +158,25 @@ class TestValidate:
         result = runner.invoke(main, ["validate", str(bad_seed)])
         assert result.exit_code != 0
 
-    def test_all_built_in_seeds_valid(self, runner: CliRunner) -> None:
-        seeds_dir = Path(__file__).parent.parent / "seeds"
-        for seed_file in seeds_dir.glob("*.yaml"):
-            result = runner.invoke(main, ["validate", str(seed_file)])
-            assert result.exit_code == 0, f"Validation failed for {seed_file.name}: {result.output}"
+    @pytest.mark.parametrize("seed_file", BUILT_IN_SEEDS, ids=os.path.basename)
+    def test_all_built_in_seeds_valid(self, runner: CliRunner, seed_file: str) -> None:
+        result = runner.invoke(main, ["validate", seed_file])
+        assert result.exit_code == 0, f"Validation failed for {os.path.basename(seed_file)}: {result.output}"
 
 
 class TestStatus:
     """Tests for the 'osp status' command."""
 
-    def test_status_shows_workspace_info(self, runner: CliRunner, tmp_path: Path) -> None:
+    def test_status_shows_workspace_info(self, runner: CliRunner, workspace: Path) -> None:
         """Status should display seed name, version, and install time."""
-        workspace = tmp_path / "ws"
-        runner.invoke(main, ["init", "--seed", "tabula_rasa", "--workspace", str(workspace)])
-
         result = runner.invoke(main, ["status", "--workspace", str(workspace)])
         assert result.exit_code == 0
         # Display name is shown (The Observer for tabula_rasa)
         assert "Observer" in result.output
         assert "Workspace:" in result.output
 
-    def test_status_shows_osp_version(self, runner: CliRunner, tmp_path: Path) -> None:
+    def test_status_shows_osp_version(self, runner: CliRunner, workspace: Path) -> None:
         """Status should display the OSP version used for installation."""
-        workspace = tmp_path / "ws"
-        runner.invoke(main, ["init", "--seed", "tabula_rasa", "--workspace", str(workspace)])
-
         result = runner.invoke(main, ["status", "--workspace", str(workspace)])
         assert result.exit_code == 0
         assert "0.2.0" in result.output
@@ -167,73 +209,75 @@ class TestStatus:
 class TestUpdateDryRun:
     """Tests for 'osp update --dry-run' command."""
 
-    def test_dry_run_shows_preview(self, runner: CliRunner, tmp_path: Path) -> None:
+    def test_dry_run_shows_preview(self, dry_run: tuple[Result, Path, str]) -> None:
         """Dry run should show what would change without modifying files."""
-        workspace = tmp_path / "ws"
-        runner.invoke(main, ["init", "--seed", "tabula_rasa", "--workspace", str(workspace)])
-
-        result = runner.invoke(main, ["update", "--workspace", str(workspace), "--dry-run"])
+        result, _, _ = dry_run
         assert result.exit_code == 0
         assert "dry-run" in result.output.lower() or "preview" in result.output.lower() or "would" in result.output.lower()
 
-    def test_dry_run_preserves_files(self, runner: CliRunner, tmp_path: Path) -> None:
+    def test_dry_run_preserves_files(self, dry_run: tuple[Result, Path, str]) -> None:
         """Dry run must not modify any files."""
-        workspace = tmp_path / "ws"
-        runner.invoke(main, ["init", "--seed", "tabula_rasa", "--workspace", str(workspace)])
-
-        # Get original content
-        soul_path = workspace / "SOUL.md"
-        original_content = soul_path.read_text()
-
-        result = runner.invoke(main, ["update", "--workspace", str(workspace), "--dry-run"])
+        _, workspace, soul_before = dry_run
 
         # Content should be unchanged
-        assert soul_path.read_text() == original_content
+        assert (workspace / "SOUL.md").read_text() == soul_before
 
-    def test_dry_run_shows_file_strategies(self, runner: CliRunner, tmp_path: Path) -> None:
+    def test_dry_run_shows_file_strategies(self, dry_run: tuple[Result, Path, str]) -> None:
         """Dry run should indicate which files would be overwritten vs merged vs preserved."""
-        workspace = tmp_path / "ws"
-        runner.invoke(main, ["init", "--seed", "tabula_rasa", "--workspace", str(workspace)])
-
-        result = runner.invoke(main, ["update", "--workspace", str(workspace), "--dry-run"])
+        result, _, _ = dry_run
         # Should show some indication of file strategies
         assert "IDENTITY.md" in result.output or "overwritten" in result.output.lower()
 
-    def test_dry_run_no_backup_created(self, runner: CliRunner, tmp_path: Path) -> None:
-        """Dry run must not create backups."""
-        workspace = tmp_path / "ws"
-        runner.invoke(main, ["init", "--seed", "tabula_rasa", "--workspace", str(workspace)])
-
+    def test_dry_run_when_up_to_date_plans_nothing(self, runner: CliRunner, workspace: Path) -> None:
+        """Dry run of an up-to-date workspace lists no changes."""
         result = runner.invoke(main, ["update", "--workspace", str(workspace), "--dry-run"])
+        assert result.exit_code == 0
+        assert "Already up to date" in result.output
+        assert "Changes (dry-run)" not in result.output
+
+    def test_dry_run_no_backup_created(self, dry_run: tuple[Result, Path, str]) -> None:
+        """Dry run must not create backups."""
+        _, workspace, _ = dry_run
 
         # No backup should be created
         backup_dir = workspace / ".osp" / "backups"
-        assert not backup_dir.exists() or len(list(backup_dir.iterdir())) == 0
+        if backup_dir.exists():
+            with os.scandir(backup_dir) as entries:
+                assert not any(entries)
 
 
 class TestUpdate:
     """Tests for 'osp update' command (actual update)."""
 
-    def test_update_same_version_no_changes(self, runner: CliRunner, tmp_path: Path) -> None:
+    def test_update_same_version_no_changes(self, runner: CliRunner, workspace: Path) -> None:
         """Update to same version should report no changes needed."""
-        workspace = tmp_path / "ws"
-        runner.invoke(main, ["init", "--seed", "tabula_rasa", "--workspace", str(workspace)])
-
         result = runner.invoke(main, ["update", "--workspace", str(workspace)])
         # Should succeed (either no changes or same version message)
         assert result.exit_code == 0
+        assert "Already up to date" in result.output
 
-    def test_update_creates_backup(self, runner: CliRunner, tmp_path: Path) -> None:
-        """Update should create a backup of existing files."""
-        workspace = tmp_path / "ws"
-        runner.invoke(main, ["init", "--seed", "tabula_rasa", "--workspace", str(workspace)])
+    def test_update_when_up_to_date_is_noop(self, runner: CliRunner, workspace: Path) -> None:
+        """Update of a current workspace only reports that it is up to date."""
+        before = {p.name: p.read_bytes() for p in workspace.glob("*.md")}
 
+        result = runner.invoke(main, ["update", "--workspace", str(workspace)])
+
+        assert result.exit_code == 0
+        assert result.output == (
+            "Current: v1.0 (latest)\n"
+            "Already up to date. Use --force to re-apply seed files.\n"
+        )
+        assert {p.name: p.read_bytes() for p in workspace.glob("*.md")} == before
+        assert not (workspace / ".osp" / "backups").exists()
+
+    def test_update_creates_backup(self, runner: CliRunner, workspace: Path) -> None:
+        """Update should create a backup of existing files."""
         # Modify a file to verify backup
         soul_path = workspace / "SOUL.md"
         original_content = soul_path.read_text()
         soul_path.write_text(original_content + "\n\n# Modified!")
 
-        result = runner.invoke(main, ["update", "--workspace", str(workspace)])
+        result = runner.invoke(main, ["update", "--workspace", str(workspace), "--force"])
 
         # Backup should exist
         backup_dir = workspace / ".osp" / "backups"
@@ -241,17 +285,15 @@ class TestUpdate:
             # Backup should be created
             assert backup_dir.exists(), "Backup directory should exist after update"
 
-    def test_update_preserves_memory(self, runner: CliRunner, tmp_path: Path) -> None:
+    def test_update_preserves_memory(self, runner: CliRunner, workspace: Path) -> None:
         """Update must preserve MEMORY.md content."""
-        workspace = tmp_path / "ws"
-        runner.invoke(main, ["init", "--seed", "tabula_rasa", "--workspace", str(workspace)])
-
         # Add custom content to MEMORY.md
         memory_path = workspace / "MEMORY.md"
         custom_memory = memory_path.read_text() + "\n\n## Custom Memory\nMy precious memories!"
         memory_path.write_text(custom_memory)
 
-        result = runner.invoke(main, ["update", "--workspace", str(workspace)])
+        result = runner.invoke(main, ["update", "--workspace", str(workspace), "--force"])
+        assert result.exit_code == 0
 
         # Memory should be preserved
         assert custom_memory in memory_path.read_text()
@@ -278,11 +320,8 @@ class TestUpdate:
         ])
         assert result.exit_code == 0
 
-    def test_update_with_seed_option(self, runner: CliRunner, tmp_path: Path) -> None:
+    def test_update_with_seed_option(self, runner: CliRunner, workspace: Path) -> None:
         """Update --seed should allow switching to different seed."""
-        workspace = tmp_path / "ws"
-        runner.invoke(main, ["init", "--seed", "tabula_rasa", "--workspace", str(workspace)])
-
         result = runner.invoke(main, [
             "update", "--workspace", str(workspace),
             "--seed", "glitch"
@@ -296,12 +335,9 @@ class TestUpdate:
         result = runner.invoke(main, ["update", "--workspace", str(workspace)])
         assert result.exit_code != 0
 
-    def test_update_shows_summary(self, runner: CliRunner, tmp_path: Path) -> None:
+    def test_update_shows_summary(self, runner: CliRunner, workspace: Path) -> None:
         """Update should show a summary of changes."""
-        workspace = tmp_path / "ws"
-        runner.invoke(main, ["init", "--seed", "tabula_rasa", "--workspace", str(workspace)])
-
-        result = runner.invoke(main, ["update", "--workspace", str(workspace)])
+        result = runner.invoke(main, ["update", "--workspace", str(workspace), "--force"])
         assert result.exit_code == 0
         # Should show some form of summary (updated/preserved/complete)
         output_lower = result.output.lower()
@@ -13,6 +13,8 @@ from osp.drives import (
     translate_drive,
 )
 
+_DRIVE_NAMES = tuple(DRIVE_DESCRIPTIONS)
+
 
 class TestValueToTier:
     """Tier boundary classification tests."""
@@ -50,12 +52,12 @@ class TestValueToTier:
 class TestTranslateDrive:
     """Individual drive translation tests."""
 
-    @pytest.mark.parametrize("drive_name", list(DRIVE_DESCRIPTIONS.keys()))
+    @pytest.mark.parametrize("drive_name", _DRIVE_NAMES)
     def test_known_drives_have_all_tiers(self, drive_name: str) -> None:
         for tier in TIER_NAMES:
             assert tier in DRIVE_DESCRIPTIONS[drive_name]
 
-    @pytest.mark.parametrize("drive_name", list(DRIVE_DESCRIPTIONS.keys()))
+    @pytest.mark.parametrize("drive_name", _DRIVE_NAMES)
     def test_known_drive_returns_string(self, drive_name: str) -> None:
         result = translate_drive(drive_name, 0.5)
         assert isinstance(result, str)
@@ -71,47 +73,22 @@ class TestTranslateDrive:
 
     # === New drives: humor, ambition, loyalty ===
 
-    def test_humor_dominant_contains_keyword(self) -> None:
-        result = translate_drive("humor", 0.9)
-        assert any(
-            w in result.lower()
-            for w in ["humor", "laugh", "joke", "absurd", "comic", "wit"]
-        )
-
-    def test_humor_dormant_contains_keyword(self) -> None:
-        result = translate_drive("humor", 0.05)
-        assert any(
-            w in result.lower()
-            for w in ["humor", "literal", "serious", "joke"]
-        )
-
-    def test_ambition_dominant_contains_keyword(self) -> None:
-        result = translate_drive("ambition", 0.85)
-        assert any(
-            w in result.lower()
-            for w in ["ambition", "conquer", "greatness", "goal", "drive", "relentless"]
-        )
-
-    def test_ambition_dormant_contains_keyword(self) -> None:
-        result = translate_drive("ambition", 0.1)
-        assert any(
-            w in result.lower()
-            for w in ["ambition", "content", "goal", "aspiration", "present"]
-        )
-
-    def test_loyalty_dominant_contains_keyword(self) -> None:
-        result = translate_drive("loyalty", 0.9)
-        assert any(
-            w in result.lower()
-            for w in ["loyal", "devotion", "unwavering", "bond", "protect", "user"]
-        )
-
-    def test_loyalty_dormant_contains_keyword(self) -> None:
-        result = translate_drive("loyalty", 0.05)
-        assert any(
-            w in result.lower()
-            for w in ["loyal", "allegiance", "independent", "attachment", "bond"]
-        )
+    @pytest.mark.parametrize(
+        "drive_name, value, keywords",
+        [
+            ("humor", 0.9, ("humor", "laugh", "joke", "absurd", "comic", "wit")),
+            ("humor", 0.05, ("humor", "literal", "serious", "joke")),
+            ("ambition", 0.85, ("ambition", "conquer", "greatness", "goal", "drive", "relentless")),
+            ("ambition", 0.1, ("ambition", "content", "goal", "aspiration", "present")),
+            ("loyalty", 0.9, ("loyal", "devotion", "unwavering", "bond", "protect", "user")),
+            ("loyalty", 0.05, ("loyal", "allegiance", "independent", "attachment", "bond")),
+        ],
+        ids=["humor-dominant", "humor-dormant", "ambition-dominant", "ambition-dormant",
+             "loyalty-dominant", "loyalty-dormant"],
+    )
+    def test_new_drive_contains_keyword(self, drive_name: str, value: float, keywords: tuple[str, ...]) -> None:
+        result = translate_drive(drive_name, value).lower()
+        assert any(w in result for w in keywords)
 
     def test_new_drives_have_all_tiers(self) -> None:
         for drive_name in ("humor", "ambition", "loyalty"):
@@ -121,6 +98,19 @@ class TestTranslateDrive:
                     f"{drive_name} missing tier {tier}"
                 )
 
+    @pytest.mark.parametrize("drive_name", _DRIVE_NAMES)
+    def test_known_drive_matches_description_for_every_tier(self, drive_name: str) -> None:
+        for i, tier in enumerate(TIER_NAMES):
+            value = i * 0.2 + 0.1
+            assert translate_drive(drive_name, value) == DRIVE_DESCRIPTIONS[drive_name][tier]
+            assert translate_all_drives({drive_name: value})[drive_name] == DRIVE_DESCRIPTIONS[drive_name][tier]
+
+    def test_drive_descriptions_are_read_only(self) -> None:
+        with pytest.raises(TypeError):
+            DRIVE_DESCRIPTIONS["curiosity"]["high"] = "mutated"  # type: ignore[index]
+        with pytest.raises(TypeError):
+            DRIVE_DESCRIPTIONS["new_drive"] = {}  # type: ignore[index]
+
     def test_unknown_drive_uses_generic_template(self) -> None:
         result = translate_drive("wanderlust", 0.7)
         assert "wanderlust" in result
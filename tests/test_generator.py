@@ -3,6 +3,7 @@
 Covers: seed resolution, workspace generation, file writing, and preview.
 """
 
+import os
 import pytest
 from pathlib import Path
 
@@ -10,12 +11,15 @@ from osp.generator import (
     SEEDS_DIR,
     generate_workspace,
     init_workspace,
+    iter_workspace,
     list_available_seeds,
     preview_file,
     resolve_seed_path,
+    write_workspace,
 )
+from osp import generator, templates
 from osp.models import Seed
-from osp.templates import TEMPLATE_REGISTRY
+from osp.templates import TEMPLATE_REGISTRY, build_render_context
 
 
 # === Fixtures ===
@@ -74,6 +78,38 @@ class TestResolveSeedPath:
         with pytest.raises(FileNotFoundError, match="not found"):
             resolve_seed_path("nonexistent_soul")
 
+    def test_finds_seed_added_after_failed_lookup(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            resolve_seed_path("late", tmp_path)
+        (tmp_path / "late.yml").write_text("meta: {}\n", encoding="utf-8")
+        assert resolve_seed_path("late", tmp_path) == tmp_path / "late.yml"
+
+    def test_forgets_deleted_and_renamed_seeds(self, tmp_path: Path) -> None:
+        seed = tmp_path / "moving.yaml"
+        seed.write_text("meta: {}\n", encoding="utf-8")
+        assert resolve_seed_path("moving", tmp_path) == seed
+
+        seed.rename(tmp_path / "moving.yml")
+        assert resolve_seed_path("moving", tmp_path) == tmp_path / "moving.yml"
+
+        (tmp_path / "moving.yml").unlink()
+        with pytest.raises(FileNotFoundError):
+            resolve_seed_path("moving", tmp_path)
+
+    def test_relative_seeds_dir_follows_working_directory(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        for name in ("a", "b"):
+            (tmp_path / name / "seeds").mkdir(parents=True)
+        (tmp_path / "a" / "seeds" / "here.yaml").write_text("meta: {}\n", encoding="utf-8")
+
+        monkeypatch.chdir(tmp_path / "a")
+        assert resolve_seed_path("here", Path("seeds")).is_file()
+
+        monkeypatch.chdir(tmp_path / "b")
+        with pytest.raises(FileNotFoundError):
+            resolve_seed_path("here", Path("seeds"))
+
 
 class TestListAvailableSeeds:
     def test_lists_all_seeds(self) -> None:
@@ -97,6 +133,34 @@ class TestListAvailableSeeds:
         seeds = list_available_seeds(empty_dir)
         assert seeds == []
 
+    def test_display_name_from_meta_block(self, tmp_path: Path) -> None:
+        (tmp_path / "custom.yaml").write_text(
+            "# comment\nmeta:\n  seed_id: \"c\"\n  name: \"Custom Soul\"\n\nnucleus: [unparsed\n",
+            encoding="utf-8",
+        )
+        seeds = list_available_seeds(tmp_path)
+        assert seeds[0]["display_name"] == "Custom Soul"
+
+    def test_meta_block_parse_error_retries_full_document(self, tmp_path: Path) -> None:
+        (tmp_path / "aliased.yaml").write_text(
+            "names:\n  - &soul \"Aliased Soul\"\nmeta:\n  name: *soul\n",
+            encoding="utf-8",
+        )
+        seeds = list_available_seeds(tmp_path)
+        assert seeds[0]["display_name"] == "Aliased Soul"
+
+    def test_unparseable_seed_falls_back_to_stem(self, tmp_path: Path) -> None:
+        (tmp_path / "broken.yaml").write_text("meta: [unclosed\n", encoding="utf-8")
+        seeds = list_available_seeds(tmp_path)
+        assert seeds[0]["display_name"] == "broken"
+
+    def test_lists_yaml_and_yml_sorted_by_name(self, tmp_path: Path) -> None:
+        for name in ("b.yaml", "a.yml", "c.yml", "notes.txt"):
+            (tmp_path / name).write_text("meta:\n  name: \"X\"\n", encoding="utf-8")
+        (tmp_path / "dir.yaml").mkdir()
+        seeds = list_available_seeds(tmp_path)
+        assert [s["name"] for s in seeds] == ["a", "b", "c"]
+
 
 # === Workspace Generation ===
 
@@ -122,6 +186,32 @@ class TestGenerateWorkspace:
         workspace = generate_workspace(sample_seed)
         assert set(workspace.keys()) == set(TEMPLATE_REGISTRY.keys())
 
+    def test_iter_workspace_yields_in_registry_order(self, sample_seed: Seed) -> None:
+        files = iter_workspace(sample_seed)
+        assert next(files)[0] == next(iter(TEMPLATE_REGISTRY))
+        assert [name for name, _ in iter_workspace(sample_seed)] == list(TEMPLATE_REGISTRY)
+
+    def test_threaded_generation_matches_sequential(self, sample_seed: Seed) -> None:
+        threaded = generate_workspace(sample_seed, max_workers=4)
+        assert threaded == generate_workspace(sample_seed)
+        assert list(threaded) == list(TEMPLATE_REGISTRY)
+
+    @pytest.mark.parametrize("max_workers", [None, 4])
+    def test_builds_shared_context_once(
+        self, sample_seed: Seed, max_workers, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A whole-workspace pass should build the template context once."""
+        calls = []
+
+        def counting_build(seed: Seed) -> dict:
+            calls.append(seed)
+            return build_render_context(seed)
+
+        monkeypatch.setattr(generator, "build_render_context", counting_build)
+        monkeypatch.setattr(templates, "build_render_context", counting_build)
+        generate_workspace(sample_seed, max_workers=max_workers)
+        assert calls == [sample_seed]
+
     def test_all_files_are_nonempty_strings(self, sample_seed: Seed) -> None:
         """Core files should always be non-empty. STORY.md may be empty."""
         workspace = generate_workspace(sample_seed)
@@ -282,6 +372,35 @@ class TestInitWorkspace:
             init_workspace("nonexistent", tmp_workspace)
 
 
+class TestWriteWorkspace:
+    def test_threaded_write_matches_serial(self, sample_seed: Seed, tmp_path: Path) -> None:
+        workspace = generate_workspace(sample_seed)
+        serial = write_workspace(workspace, tmp_path / "serial")
+        threaded = write_workspace(workspace, tmp_path / "threaded", max_workers=4)
+
+        assert [p.name for p in threaded] == [p.name for p in serial]
+        assert STORY_FILE not in {p.name for p in threaded}
+        for path in threaded:
+            assert path.read_bytes() == workspace[path.name].encode("utf-8")
+
+    def test_skips_blank_content(self, tmp_path: Path) -> None:
+        files = {"A.md": "text\n", "B.md": "", "C.md": " \n\t\n"}
+        written = write_workspace(files, tmp_path)
+        assert [p.name for p in written] == ["A.md"]
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_new_files_follow_umask(self, tmp_path: Path) -> None:
+        """New files get the same mode as Path.write_text under a permissive umask."""
+        old_umask = os.umask(0o002)
+        try:
+            (written,) = write_workspace({"A.md": "text\n"}, tmp_path / "out")
+            reference = tmp_path / "reference.md"
+            reference.write_text("text\n", encoding="utf-8")
+        finally:
+            os.umask(old_umask)
+        assert written.stat().st_mode & 0o777 == reference.stat().st_mode & 0o777 == 0o664
+
+
 # === Preview ===
 
 class TestPreviewFile:
@@ -303,6 +422,15 @@ class TestPreviewFile:
             content = preview_file(seed_name)
             assert len(content) > 100
 
+    def test_preview_reflects_edited_seed_file(self, tmp_path: Path) -> None:
+        seed_path = tmp_path / "custom.yaml"
+        original = (SEEDS_DIR / "tabula_rasa.yaml").read_text(encoding="utf-8")
+        seed_path.write_text(original, encoding="utf-8")
+        assert "The Observer" in preview_file(str(seed_path), "IDENTITY.md")
+
+        seed_path.write_text(original.replace("The Observer", "The Edited Observer"), encoding="utf-8")
+        assert "The Edited Observer" in preview_file(str(seed_path), "IDENTITY.md")
+
 
 # === Real-time Evolution ===
 
@@ -136,6 +136,16 @@ No drives here.
         values = extract_drive_values(soul_md)
         assert values == {"Curiosity": 0.85}
 
+    def test_ignores_malformed_decimals(self) -> None:
+        """Should skip numbers like '1.2.3' but accept '.5' and '5.'."""
+        soul_md = """### Curiosity (1.2.3)
+### Empathy (..)
+### Order (.5)
+### Chaos (1.)
+"""
+        values = extract_drive_values(soul_md)
+        assert values == {"Order": 0.5, "Chaos": 1.0}
+
     def test_handles_extreme_float_strings(self) -> None:
         """Should handle extreme float strings that might cause parsing issues."""
         soul_md = """## Core Drives
@@ -194,6 +204,20 @@ Desc.
         assert "### Curiosity (0.8)" in result
         assert "### Empathy (0.7)" in result
 
+    def test_rewrites_malformed_values(self) -> None:
+        """Malformed numbers are replaced; negative values are left alone."""
+        soul_md = "### Curiosity (1.2.3)\n### Chaos (.)\n### Empathy (-0.3)\n"
+        result = apply_drive_values(soul_md, {"Curiosity": 0.8, "Chaos": 0.4, "Empathy": 0.7})
+        assert result == "### Curiosity (0.8)\n### Chaos (0.4)\n### Empathy (-0.3)\n"
+
+    def test_returns_input_when_values_already_match(self) -> None:
+        """Should hand back the same string when nothing needs rewriting."""
+        soul_md = "### Curiosity (0.8)\n\n### Empathy ( 0.70 )\n"
+        assert apply_drive_values(soul_md, {"Curiosity": 0.8}) is soul_md
+        # Formatting differences still normalize as before
+        result = apply_drive_values(soul_md, {"Empathy": 0.7})
+        assert "### Empathy (0.7)" in result
+
     def test_preserves_other_content(self) -> None:
         """Should not modify other parts of the file."""
         soul_md = """# Soul Core
@@ -550,6 +574,21 @@ class TestExtractSkills:
 class TestMergeAgentsMd:
     """Tests for merging AGENTS.md files - union of skills."""
 
+    def test_normalizes_crlf_header(self) -> None:
+        """Windows line endings in the upstream header become plain newlines."""
+        local = "- `fs.read`\n"
+        upstream = "# Available Tools\r\n\r\n- `shell.exec`\r\n"
+        merged = merge_agents_md(local, upstream)
+        assert merged.startswith("# Available Tools\n\n- `fs.read`\n- `shell.exec`")
+
+    @pytest.mark.parametrize("separator", ["\u2028", "\x0c", "\x85"])
+    def test_keeps_unicode_separators_in_header(self, separator: str) -> None:
+        """Only newlines split the header; other line separators stay in place."""
+        local = "- `fs.read`\n"
+        upstream = f"# Available{separator}Tools\r\n\n- `shell.exec`\n"
+        merged = merge_agents_md(local, upstream)
+        assert merged.startswith(f"# Available{separator}Tools\n\n- `fs.read`\n- `shell.exec`")
+
     def test_merges_skills_union(self) -> None:
         """Should combine skills from both local and upstream."""
         local = """# Available Tools
@@ -658,6 +697,13 @@ class TestMergeAgentsMd:
 class TestMergeStoryMd:
     """Tests for merging STORY.md files - preserves Our Story section."""
 
+    def test_replaces_only_the_our_story_section(self) -> None:
+        """Text identical to upstream's section elsewhere must be left alone."""
+        local = "## Our Story\n\nLocal chapters."
+        upstream = "## Our Story\n## Quotes\n\n> ## Our Story"
+        merged = merge_story_md(local, upstream)
+        assert merged == "## Our Story\n\nLocal chapters.\n## Quotes\n\n> ## Our Story"
+
     def test_preserves_local_our_story(self) -> None:
         """Should keep local Our Story section when merging."""
         local = """# My Story
@@ -11,7 +11,7 @@ from pathlib import Path
 import pytest
 import yaml
 
-from osp.validator import validate_file, validate_structure
+from osp.validator import load_seed_data, validate_file, validate_file_fast, validate_structure
 from osp.models import Seed
 
 SEEDS_DIR = Path(__file__).parent.parent / "seeds"
@@ -30,6 +30,9 @@ class TestSeedValidation:
         result = validate_file(seed_path)
         assert result.is_valid, f"Errors in {seed_path.name}: {result.errors}"
 
+    def test_fast_path_accepts_seed(self, seed_path: Path) -> None:
+        assert validate_file_fast(seed_path) == validate_file(seed_path)
+
     def test_seed_parses_to_model(self, seed_path: Path) -> None:
         with open(seed_path, "r", encoding="utf-8") as f:
             data = yaml.safe_load(f)
@@ -71,6 +74,36 @@ class TestValidationEdgeCases:
         errors = validate_structure(data)
         assert any("not a number" in e for e in errors)
 
+    def test_undecodable_file_is_reported_as_invalid_yaml(self, tmp_path: Path) -> None:
+        seed_file = tmp_path / "broken.yaml"
+        seed_file.write_bytes(b"meta:\n  name: \xff\xfe\xfa\n")
+        result = validate_file(seed_file)
+        assert not result.is_valid
+        assert "Invalid YAML" in result.errors[0]
+
+    @pytest.mark.parametrize(
+        "edit",
+        [
+            ("curiosity: 0.8", "curiosity: 1.8"),
+            ("curiosity: 0.8", "curiosity: high"),
+            ("  name: Test Soul", "  nickname: Test Soul"),
+            ("pulse:", "other:"),
+            ("  seed_id: test_001", "  seed_id: !!str 42"),
+            ("  seed_id: test_001", "  seed_id: &id test_001\n  alias: &id x"),
+        ],
+        ids=["out-of-range", "non-numeric", "missing-field", "missing-root", "tagged", "duplicate-anchor"],
+    )
+    def test_fast_path_matches_full_validation(self, tmp_path: Path, edit: tuple[str, str]) -> None:
+        text = (
+            "meta:\n  seed_id: test_001\n  name: Test Soul\n  version: 1.0\n"
+            "nucleus:\n  drives:\n    curiosity: 0.8\n  prime_directives: []\n"
+            "persona:\n  current_mission: null\n  unlocked_skills: []\n  memory_summary: ''\n"
+            "pulse:\n  tone: []\n  formatting_preference: text\n"
+        )
+        seed_file = tmp_path / "edited.yaml"
+        seed_file.write_text(text.replace(*edit), encoding="utf-8")
+        assert validate_file_fast(seed_file) == validate_file(seed_file)
+
 
 class TestConsumerSeeds:
     """Validate consumer-facing seeds have appropriate emotional profiles."""
@@ -111,6 +144,29 @@ class TestConsumerSeeds:
         assert drives["chaos"] >= 0.75, "Cat should be unpredictable"
 
 
+class TestLoadSeedData:
+    """Memoized seed loading."""
+
+    def test_returns_independent_copies(self) -> None:
+        first = load_seed_data(SEEDS_DIR / "tabula_rasa.yaml")
+        first["meta"]["name"] = "Mutated"
+        second = load_seed_data(SEEDS_DIR / "tabula_rasa.yaml")
+        assert second["meta"]["name"] != "Mutated"
+
+    def test_reloads_edited_file(self, tmp_path: Path) -> None:
+        seed_file = tmp_path / "edited.yaml"
+        original = (SEEDS_DIR / "tabula_rasa.yaml").read_text(encoding="utf-8")
+        seed_file.write_text(original, encoding="utf-8")
+        name = load_seed_data(seed_file)["meta"]["name"]
+
+        seed_file.write_text(original.replace(name, "A Renamed Soul"), encoding="utf-8")
+        assert load_seed_data(seed_file)["meta"]["name"] == "A Renamed Soul"
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError, match="Seed file not found"):
+            load_seed_data(tmp_path / "missing.yaml")
+
+
 # === Standalone script mode (backward compatibility) ===
 
 def main() -> None:
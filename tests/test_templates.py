@@ -7,9 +7,12 @@ import pytest
 
 from osp.models import Seed
 from osp.templates import (
+    render_boot_md,
+    render_identity_md,
     render_heartbeat_md,
     render_evolution_log_md,
     render_story_md,
+    TEMPLATE_ITEMS,
     TEMPLATE_REGISTRY,
 )
 
@@ -183,6 +186,10 @@ class TestRenderEvolutionLogMd:
         """EVOLUTION_LOG.md should be registered in the template registry."""
         assert "EVOLUTION_LOG.md" in TEMPLATE_REGISTRY
 
+    def test_template_items_mirror_registry(self) -> None:
+        """TEMPLATE_ITEMS should list the registry's pairs in registry order."""
+        assert TEMPLATE_ITEMS == tuple(TEMPLATE_REGISTRY.items())
+
 
 # === STORY.md Evolution Tests (NEW) ===
 
@@ -212,3 +219,22 @@ class TestRenderStoryMdEvolution:
         result = render_story_md(seed_with_story)
         assert "First test" in result
         assert "It passed" in result
+
+
+# === Registry Isolation Tests ===
+
+
+class TestTemplateRegistryIsolation:
+    """Tests that registry renderers never leak output between seeds."""
+
+    def test_distinct_seeds_render_independently(self, sample_seed: Seed, seed_with_story: Seed) -> None:
+        """A different Seed object should never receive another seed's output."""
+        render = TEMPLATE_REGISTRY["STORY.md"]
+        assert render(sample_seed) == ""
+        assert "First test" in render(seed_with_story)
+
+    def test_shared_context_follows_the_seed(self, sample_seed: Seed, seed_with_story: Seed) -> None:
+        """Alternating seeds should never reuse the other seed's substitutions."""
+        assert "**Test Soul**" in render_identity_md(sample_seed)
+        assert "**Story Test**" in render_boot_md(seed_with_story)
+        assert "**Test Soul**" in render_boot_md(sample_seed)
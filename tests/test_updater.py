@@ -5,6 +5,7 @@ Phase 3: Update pipeline (backup, file strategies, update_workspace).
 """
 
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -97,6 +98,16 @@ class TestOSPMetaModel:
         with pytest.raises(AttributeError):
             meta.seed_id = "modified"  # type: ignore[misc]
 
+    def test_osp_meta_supports_dataclass_api(self, sample_osp_meta_data: dict) -> None:
+        """OSPMeta is a dataclass record, not a tuple."""
+        import dataclasses
+
+        meta = OSPMeta.from_dict(sample_osp_meta_data)
+        bumped = dataclasses.replace(meta, installed_version=2.0)
+        assert bumped.installed_version == 2.0
+        assert dataclasses.asdict(meta) == meta.to_dict()
+        assert meta != tuple(meta.to_dict().values())
+
     def test_osp_meta_from_dict(self, sample_osp_meta_data: dict) -> None:
         """OSPMeta can be created from a dictionary."""
         meta = OSPMeta.from_dict(sample_osp_meta_data)
@@ -242,6 +253,50 @@ class TestWriteOSPMeta:
         assert "installed_at" in data
         assert "osp_version" in data
 
+    def test_write_osp_meta_replaces_existing_meta(self, tmp_workspace: Path, sample_seed: Seed) -> None:
+        """write_osp_meta swaps in the new record and leaves no temp file."""
+        from osp.generator import write_osp_meta
+
+        osp_dir = tmp_workspace / ".osp"
+        osp_dir.mkdir(parents=True)
+        (osp_dir / "meta.json").write_text('{"stale": true}', encoding="utf-8")
+
+        meta_path = write_osp_meta(tmp_workspace, sample_seed, "test_seed")
+
+        assert json.loads(meta_path.read_text())["seed_id"] == "test_001"
+        assert sorted(p.name for p in osp_dir.iterdir()) == ["meta.json"]
+
+    def test_write_osp_meta_cleans_up_when_replace_fails(
+        self, tmp_workspace: Path, sample_seed: Seed, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A failed rename removes the temp file and keeps the old record."""
+        from osp import generator
+
+        osp_dir = tmp_workspace / ".osp"
+        osp_dir.mkdir(parents=True)
+        (osp_dir / "meta.json").write_text('{"stale": true}', encoding="utf-8")
+
+        def failing_replace(src, dst) -> None:
+            raise OSError("rename failed")
+
+        monkeypatch.setattr(generator.os, "replace", failing_replace)
+        with pytest.raises(OSError, match="rename failed"):
+            generator.write_osp_meta(tmp_workspace, sample_seed, "test_seed")
+
+        assert sorted(p.name for p in osp_dir.iterdir()) == ["meta.json"]
+        assert json.loads((osp_dir / "meta.json").read_text()) == {"stale": True}
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_write_osp_meta_uses_default_file_mode(self, tmp_workspace: Path, sample_seed: Seed) -> None:
+        """meta.json gets the same permissions as a file created with open()."""
+        from osp.generator import write_osp_meta
+
+        meta_path = write_osp_meta(tmp_workspace, sample_seed, "test_seed")
+        reference = tmp_workspace / "reference.txt"
+        reference.write_text("", encoding="utf-8")
+
+        assert meta_path.stat().st_mode & 0o777 == reference.stat().st_mode & 0o777
+
     def test_write_osp_meta_includes_current_osp_version(self, tmp_workspace: Path, sample_seed: Seed) -> None:
         """write_osp_meta includes current OSP version."""
         from osp.generator import write_osp_meta
@@ -526,6 +581,19 @@ class TestCreateBackup:
         assert not (backup_path / "config.json").exists()
         assert not (backup_path / "data.txt").exists()
 
+    def test_skips_directories_named_like_md(self, tmp_workspace: Path) -> None:
+        """create_backup only copies regular files, not directories ending in .md."""
+        from osp.updater import create_backup
+
+        tmp_workspace.mkdir(parents=True, exist_ok=True)
+        (tmp_workspace / "SOUL.md").write_text("# Soul", encoding="utf-8")
+        (tmp_workspace / "notes.md").mkdir()
+
+        backup_path = create_backup(tmp_workspace)
+
+        assert (backup_path / "SOUL.md").is_file()
+        assert not (backup_path / "notes.md").exists()
+
     def test_handles_empty_workspace(self, tmp_workspace: Path) -> None:
         """create_backup handles workspace with no files."""
         from osp.updater import create_backup
@@ -572,6 +640,50 @@ class TestUpdateFile:
         assert change.action == "overwritten"
         assert (tmp_workspace / "IDENTITY.md").read_text() == upstream
 
+    def test_identical_content_is_not_rewritten(self, tmp_workspace: Path) -> None:
+        """Writing content the file already holds leaves the file untouched."""
+        from osp.merger import MergeStrategy
+        from osp.updater import update_file
+
+        tmp_workspace.mkdir(parents=True, exist_ok=True)
+        identity = tmp_workspace / "IDENTITY.md"
+        identity.write_bytes(b"Same content\n")
+        os.utime(identity, ns=(1_000_000_000, 1_000_000_000))
+
+        change = update_file(tmp_workspace, "IDENTITY.md", "Same content\n", MergeStrategy.OVERWRITE)
+
+        assert change.action == "overwritten"
+        assert identity.stat().st_mtime_ns == 1_000_000_000
+
+    def test_crlf_file_is_rewritten_with_lf(self, tmp_workspace: Path) -> None:
+        """A CRLF file whose text matches upstream is still normalized to LF."""
+        from osp.merger import MergeStrategy
+        from osp.updater import update_file
+
+        tmp_workspace.mkdir(parents=True, exist_ok=True)
+        identity = tmp_workspace / "IDENTITY.md"
+        identity.write_bytes(b"Same content\r\n")
+
+        update_file(tmp_workspace, "IDENTITY.md", "Same content\n", MergeStrategy.OVERWRITE)
+
+        assert identity.read_bytes() == b"Same content\n"
+
+    def test_overwrite_and_preserve_do_not_decode_local(self, tmp_workspace: Path) -> None:
+        """OVERWRITE and PRESERVE never decode the local file."""
+        from osp.merger import MergeStrategy
+        from osp.updater import update_file
+
+        tmp_workspace.mkdir(parents=True, exist_ok=True)
+        (tmp_workspace / "IDENTITY.md").write_bytes(b"\xff\xfe latin-1 junk")
+        (tmp_workspace / "MEMORY.md").write_bytes(b"\xff\xfe latin-1 junk")
+
+        update_file(tmp_workspace, "IDENTITY.md", "New identity\n", MergeStrategy.OVERWRITE)
+        change = update_file(tmp_workspace, "MEMORY.md", "New memory\n", MergeStrategy.PRESERVE)
+
+        assert (tmp_workspace / "IDENTITY.md").read_bytes() == b"New identity\n"
+        assert change.action == "preserved"
+        assert (tmp_workspace / "MEMORY.md").read_bytes() == b"\xff\xfe latin-1 junk"
+
     def test_preserve_strategy_keeps_local(self, tmp_workspace: Path) -> None:
         """PRESERVE strategy keeps local file unchanged."""
         from osp.merger import MergeStrategy
@@ -708,12 +820,21 @@ class TestUpdateWorkspace:
         modified_content = original_content.replace("0.5", "0.9")  # Change drive value
         soul_path.write_text(modified_content, encoding="utf-8")
 
-        result = update_workspace(initialized_workspace)
+        result = update_workspace(initialized_workspace, force=True)
 
         assert result.backup_path is not None
         backup_dir = Path(result.backup_path)
         assert backup_dir.exists()
 
+    def test_backup_name_matches_installed_at(self, initialized_workspace: Path) -> None:
+        """The backup directory and meta installed_at come from one clock read."""
+        from osp.updater import update_workspace
+
+        result = update_workspace(initialized_workspace, force=True)
+
+        meta = json.loads((initialized_workspace / ".osp" / "meta.json").read_text())
+        assert Path(result.backup_path).name == meta["installed_at"].replace(":", "-")
+
     def test_update_preserves_memory_md(self, initialized_workspace: Path) -> None:
         """update_workspace preserves MEMORY.md (PRESERVE strategy)."""
         from osp.updater import update_workspace
@@ -723,7 +844,7 @@ class TestUpdateWorkspace:
         original_content = "Modified local memory content."
         memory_path.write_text(original_content, encoding="utf-8")
 
-        result = update_workspace(initialized_workspace)
+        result = update_workspace(initialized_workspace, force=True)
 
         # MEMORY.md should still have local content
         assert memory_path.read_text() == original_content
@@ -739,7 +860,7 @@ class TestUpdateWorkspace:
         identity_path = initialized_workspace / "IDENTITY.md"
         original_content = identity_path.read_text()
 
-        result = update_workspace(initialized_workspace)
+        result = update_workspace(initialized_workspace, force=True)
 
         # Check change record
         identity_changes = [c for c in result.changes if c.filename == "IDENTITY.md"]
@@ -759,7 +880,7 @@ class TestUpdateWorkspace:
         modified_content = content.replace("### Curiosity (0.8)", "### Curiosity (0.95)")
         soul_path.write_text(modified_content, encoding="utf-8")
 
-        result = update_workspace(initialized_workspace)
+        result = update_workspace(initialized_workspace, force=True)
 
         # Drive value should be preserved
         updated_content = soul_path.read_text()
@@ -770,6 +891,52 @@ class TestUpdateWorkspace:
         assert len(soul_changes) == 1
         assert soul_changes[0].action == "smart_merged"
 
+    def test_threaded_update_matches_serial(self, tmp_path: Path) -> None:
+        """update_workspace with max_workers yields the same files and changes."""
+        from osp.generator import init_workspace
+        from osp.updater import update_workspace
+
+        results = {}
+        for name, workers in (("serial", None), ("threaded", 4)):
+            workspace = tmp_path / name
+            init_workspace("tabula_rasa", workspace)
+            (workspace / "SOUL.md").write_text("# local soul\n", encoding="utf-8")
+            (workspace / "MEMORY.md").write_text("local memory\n", encoding="utf-8")
+            result = update_workspace(workspace, force=True, max_workers=workers)
+            files = {p.name: p.read_bytes() for p in workspace.glob("*.md")}
+            results[name] = (result.changes, files)
+
+        assert results["threaded"] == results["serial"]
+
+    def test_update_is_noop_when_already_up_to_date(
+        self, initialized_workspace: Path
+    ) -> None:
+        """update_workspace skips everything when seed and OSP versions match."""
+        from osp.updater import update_workspace
+
+        result = update_workspace(initialized_workspace)
+
+        assert result.success is True
+        assert result.changes == ()
+        assert result.backup_path is None
+        assert not (initialized_workspace / ".osp" / "backups").exists()
+
+    def test_update_reapplies_after_osp_upgrade(
+        self, initialized_workspace: Path
+    ) -> None:
+        """update_workspace re-applies files written by an older OSP release."""
+        from osp.updater import update_workspace
+
+        meta_path = initialized_workspace / ".osp" / "meta.json"
+        meta_data = json.loads(meta_path.read_text())
+        meta_data["osp_version"] = "0.0.1"
+        meta_path.write_text(json.dumps(meta_data))
+
+        result = update_workspace(initialized_workspace)
+
+        assert result.success is True
+        assert {change.filename for change in result.changes} >= {"IDENTITY.md", "SOUL.md"}
+
     def test_update_with_dry_run_does_not_modify(
         self, initialized_workspace: Path
     ) -> None:
@@ -779,8 +946,10 @@ class TestUpdateWorkspace:
         soul_path = initialized_workspace / "SOUL.md"
         original_content = soul_path.read_text()
 
-        result = update_workspace(initialized_workspace, dry_run=True)
+        result = update_workspace(initialized_workspace, dry_run=True, force=True)
 
+        # Every file was planned, but none was touched
+        assert result.changes
         # Files should be unchanged
         assert soul_path.read_text() == original_content
         # No backup should be created
@@ -788,6 +957,43 @@ class TestUpdateWorkspace:
         # Should still be successful (simulation)
         assert result.success is True
 
+    def test_failing_renderer_leaves_workspace_untouched(
+        self, initialized_workspace: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A renderer error aborts the update before any file, backup or meta is written."""
+        from osp import generator
+        from osp.updater import update_workspace
+
+        def broken_render(seed: Seed, context=None) -> str:
+            raise RuntimeError("render failed")
+
+        monkeypatch.setattr(
+            generator, "TEMPLATE_ITEMS", generator.TEMPLATE_ITEMS + (("BROKEN.md", broken_render),)
+        )
+        before = {p.name: p.read_bytes() for p in initialized_workspace.rglob("*") if p.is_file()}
+
+        with pytest.raises(RuntimeError, match="render failed"):
+            update_workspace(initialized_workspace, force=True)
+
+        after = {p.name: p.read_bytes() for p in initialized_workspace.rglob("*") if p.is_file()}
+        assert after == before
+        assert not (initialized_workspace / ".osp" / "backups").exists()
+
+    def test_dry_run_reports_planned_action_per_strategy(
+        self, initialized_workspace: Path
+    ) -> None:
+        """update_workspace dry run describes each file's strategy without applying it."""
+        from osp.updater import update_workspace
+
+        result = update_workspace(initialized_workspace, dry_run=True, force=True)
+        changes = {change.filename: change for change in result.changes}
+
+        assert changes["IDENTITY.md"].action == "overwritten"
+        assert changes["MEMORY.md"].action == "preserved"
+        assert changes["SOUL.md"].action == "smart_merged"
+        assert changes["AGENTS.md"].action == "union_merged"
+        assert all(change.details.startswith("Would ") for change in result.changes)
+
     def test_update_with_force_creates_if_no_meta(
         self, tmp_workspace: Path
     ) -> None: